@@ -17,26 +17,55 @@ except:
 from pathlib import Path
 import os
 import sys
-import time
 import subprocess
 import importlib
+import hashlib
+
+def _requirements_hash(requirements_file):
+    """
+    BLAKE2b digest of requirements_manual.txt, stored in the success log so a
+    changed requirements file triggers a reinstall.
+    """
+    return hashlib.blake2b(requirements_file.read_bytes(), digest_size=16).hexdigest()
+
+def _installed_hash(success_log):
+    """
+    Read the requirements hash recorded on the first line of the success log, or None.
+    """
+    try:
+        with open(success_log, "r", encoding="utf-8", errors="replace") as f:
+            first = f.readline().strip()
+    except Exception:
+        return None
+    if first.startswith("# reqs_hash="):
+        return first[len("# reqs_hash="):]
+    return None
 
 def install_requirements_manual():
     """
     Installs packages from requirements_manual.txt into ../Packages using pip,
     with macOS SDK sysroot injected so native builds (e.g. netifaces) can compile.
+
+    If a "wheelhouse" directory of prebuilt wheels sits next to the requirements
+    file (build with: pip wheel -r requirements_manual.txt -w wheelhouse), pip
+    installs offline from it and the SDK/compiler setup is skipped.
     """
 
     current_directory = Path.cwd()              # .../Contents/Server Plugin
     parent_directory  = current_directory.parent  # .../Contents
     pip_path = f"/Library/Frameworks/Python.framework/Versions/{sys.version_info.major}.{sys.version_info.minor}/bin/pip{sys.version_info.major}.{sys.version_info.minor}"
     requirements_file = current_directory / "requirements_manual.txt"
+    wheelhouse        = current_directory / "wheelhouse"
     install_dir       = parent_directory / "Packages"
     success_log  = install_dir / "pip-install-success.txt"
 
+    reqs_hash = _requirements_hash(requirements_file) if requirements_file.exists() else None
+
     if success_log.exists():
-        indigo.server.log(f"Libraries already installed (found {success_log}). Skipping reinstall.")
-        return f"Skipped install: {success_log} exist"
+        if reqs_hash is None or _installed_hash(success_log) == reqs_hash:
+            indigo.server.log(f"Libraries already installed (found {success_log}). Skipping reinstall.")
+            return f"Skipped install: {success_log} exist"
+        indigo.server.log("requirements_manual.txt has changed since last install. Reinstalling.")
 
     installation_output = f"Installing requirements Libraries into '{install_dir}'\n"
 
@@ -51,50 +80,67 @@ def install_requirements_manual():
 
     install_dir.mkdir(parents=True, exist_ok=True)
 
-    # Inject sysroot so clang can find stdlib.h when Indigo/launchd env is minimal
-    try:
-        sdk = subprocess.check_output(
-            ["xcrun", "--sdk", "macosx", "--show-sdk-path"],
-            text=True
-        ).strip()
-    except Exception:
-        sdk = "/Library/Developer/CommandLineTools/SDKs/MacOSX.sdk"
+    # Prebuilt wheels shipped with the plugin: install offline, nothing to compile
+    use_wheelhouse = wheelhouse.is_dir()
 
     env = os.environ.copy()
-    env["SDKROOT"] = sdk
-    env.setdefault("DEVELOPER_DIR", "/Library/Developer/CommandLineTools")
-    env["CFLAGS"]   = (f"-isysroot {sdk} " + env.get("CFLAGS", "")).strip()
+    if not use_wheelhouse:
+        # Inject sysroot so clang can find stdlib.h when Indigo/launchd env is minimal.
+        # An SDKROOT already in the environment wins; only probe xcrun without one.
+        sdk = env.get("SDKROOT")
+        if not sdk:
+            try:
+                sdk = subprocess.check_output(
+                    ["xcrun", "--sdk", "macosx", "--show-sdk-path"],
+                    text=True
+                ).strip()
+            except Exception:
+                sdk = "/Library/Developer/CommandLineTools/SDKs/MacOSX.sdk"
+
+        env["SDKROOT"] = sdk
+        env.setdefault("DEVELOPER_DIR", "/Library/Developer/CommandLineTools")
+        env["CFLAGS"]   = (f"-isysroot {sdk} " + env.get("CFLAGS", "")).strip()
+
+    pip_args = [
+        pip_path, "install",
+        "-r", str(requirements_file),
+        # Needed on every path: with -t, pip skips packages whose directories already exist in
+        # the target, so a requirements-hash reinstall would otherwise replace nothing
+        "--upgrade",
+        "-t", str(install_dir),
+        "--disable-pip-version-check"
+    ]
+    if use_wheelhouse:
+        indigo.server.log(f"Installing from bundled wheelhouse: {wheelhouse}")
+        pip_args += ["--no-index", "--find-links", str(wheelhouse)]
 
     try:
-        result = subprocess.run(
-            [
-                pip_path, "install",
-                "-r", str(requirements_file),
-                "--upgrade",
-                "-t", str(install_dir),
-                "--disable-pip-version-check"
-            ],
+        # Read pip output as it is produced: the full record goes to the install log,
+        # only its tail to the Indigo event log
+        proc = subprocess.Popen(
+            pip_args,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             env=env,
-            text=False,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
         )
+        pip_out = "".join(proc.stdout)
+        returncode = proc.wait()
 
-        out_bytes = result.stdout or b""
-        pip_out = out_bytes.decode("utf-8", errors="replace")
-
-        indigo.server.log(f"pip return code: {result.returncode}", level=10)
+        indigo.server.log(f"pip return code: {returncode}", level=10)
         indigo.server.log("--- pip output (tail) ---", level=10)
         indigo.server.log(pip_out[-3000:] if len(pip_out) > 3000 else pip_out, level=10)
 
-        installation_output =  "\n--- pip output ---\n" + pip_out + f"\n--- pip return code: {result.returncode} ---\n"
+        installation_output =  "\n--- pip output ---\n" + pip_out + f"\n--- pip return code: {returncode} ---\n"
 
-        if result.returncode != 0:
+        if returncode != 0:
             indigo.server.log("ERROR: pip install failed for requirements_manual.txt")
             return installation_output
 
         try:
-            success_log.write_text(installation_output, encoding="utf-8")
+            success_log.write_text(f"# reqs_hash={reqs_hash}\n" + installation_output, encoding="utf-8")
             indigo.server.log(f"Wrote install log: {success_log}")
             installation_output += f"\nWrote install log: {success_log}\n"
         except Exception as e:
@@ -105,7 +151,6 @@ def install_requirements_manual():
         indigo.server.log("Library install completed successfully.")
         # Invalidate import caches so the next run sees new files
         importlib.invalidate_caches()
-        time.sleep(5)
         return installation_output
 
     except FileNotFoundError as e:
@@ -21,8 +21,9 @@ except ImportError:  # pragma: no cover
     indigo = None
 
 import logging
+import os
+import tempfile
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any, Optional
 
 from dreame.device import DreameVacuumDevice
@@ -104,6 +105,10 @@ class DreameCameraHelper:
 
         self._last_calibration_points: Any = None
 
+        # Last floor render, reused while the map frame and robot/station status are unchanged
+        self._last_map_key: Any = None
+        self._last_png: Optional[bytes] = None
+
     # ------------------------------------------------------------------
     # Map data helpers
     # ------------------------------------------------------------------
@@ -162,8 +167,9 @@ class DreameCameraHelper:
             _LOGGER.error(f"DreameCameraHelper: get_map_for_render failed: {ex}")
             return None
 
-        robot_status = getattr(self._device.status, "robot_status", None)
-        station_status = getattr(self._device.status, "station_status", None)
+        status = self._device.status
+        robot_status = getattr(status, "robot_status", None)
+        station_status = getattr(status, "station_status", None)
 
         try:
             image_bytes = self._renderer.render_map(render_map, robot_status, station_status)
@@ -207,7 +213,23 @@ class DreameCameraHelper:
                 except Exception:
                     return None
 
-            return self._render_map_generic(map_data)
+            status = self._device.status
+            map_key = (
+                getattr(map_data, "map_id", None),
+                getattr(map_data, "frame_id", None),
+                getattr(map_data, "last_updated", None),
+                getattr(status, "robot_status", None),
+                getattr(status, "station_status", None),
+            )
+            if self._last_png is not None and map_key == self._last_map_key:
+                _LOGGER.debug("DreameCameraHelper: floor map unchanged, reusing last render")
+                return self._last_png
+
+            image_bytes = self._render_map_generic(map_data)
+            if image_bytes:
+                self._last_map_key = map_key
+                self._last_png = image_bytes
+            return image_bytes
         except Exception as ex:
             _LOGGER.warning(f"DreameCameraHelper: floor map render failed: {ex}")
             return None
@@ -271,8 +293,9 @@ class DreameCameraHelper:
                 except Exception:
                     resources = None
 
-            robot_status = getattr(self._device.status, "robot_status", None)
-            station_status = getattr(self._device.status, "station_status", None)
+            status = self._device.status
+            robot_status = getattr(status, "robot_status", None)
+            station_status = getattr(status, "station_status", None)
 
             return self._json_renderer.get_data_string(render_map, resources, robot_status, station_status)  # type: ignore[union-attr]
         except Exception as ex:
@@ -301,8 +324,6 @@ class DreameCameraHelper:
         Returns:
             Full path to written PNG file, or None on failure.
         """
-        import os
-
         img_bytes = self.render_wifi_map() if wifi else self.render_floor_map()
         if not img_bytes:
             return None
@@ -312,15 +333,28 @@ class DreameCameraHelper:
         except Exception:
             pass
 
-        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         suffix = "Wifi" if wifi else "Floor"
         filename = f"{prefix}-{suffix}-{dev_id}.png"
         full_path = os.path.join(base_dir, filename)
+        # Write to a temp file then rename, so anything watching the folder never sees a partial PNG.
+        # The temp name is unique, so concurrent saves for the same device don't write into each other.
+        tmp_path = None
         try:
-            with open(full_path, "wb") as f:
-                f.write(img_bytes)
+            with tempfile.NamedTemporaryFile(
+                dir=base_dir, prefix=f".{filename}.", suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+                tmp.write(img_bytes)
+            # NamedTemporaryFile creates 0600; keep the snapshot readable as before
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, full_path)
         except Exception as ex:
             _LOGGER.error(f"DreameCameraHelper: failed writing snapshot to {full_path}: {ex}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
             return None
 
         return full_path
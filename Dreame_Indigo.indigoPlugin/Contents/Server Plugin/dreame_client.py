@@ -1,7 +1,11 @@
 import asyncio
+import concurrent.futures
 import logging
+import random
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from dreame.device import DreameVacuumDevice
 from dreame.protocol import DreameVacuumProtocol
@@ -14,14 +18,84 @@ except ImportError:
 
 _LOGGER = logging.getLogger("dreame_client")
 
-
-@dataclass
+# Retry policy for transport errors on reads: base * 2**attempt (capped) plus random jitter, seconds
+_RETRY_BASE = 0.5
+_RETRY_CAP = 30.0
+_RETRY_JITTER = 0.5
+
+# Default upper bound (seconds) for one blocking dreame.* call before the caller gives up
+DEFAULT_CALL_TIMEOUT = 45.0
+
+# Max commands waiting per device; more than this means the robot has stalled
+_CMD_QUEUE_MAX = 16
+
+# DreameVacuumDevice commands where a repeat queued behind an identical one changes nothing, so the
+# two callers can share one run. Toggles and one-shots (start_pause, locate, draining, segment/zone
+# jobs, raw send_command) are never merged: pressing them twice must act twice.
+_IDEMPOTENT_COMMANDS = frozenset({
+    "start",
+    "stop",
+    "pause",
+    "return_to_base",
+    "set_suction_level",
+    "start_washing",
+    "pause_washing",
+    "start_drying",
+    "stop_drying",
+})
+
+# Shared read-only stand-in for "no status attributes"
+_EMPTY_ATTRS: Mapping[str, Any] = MappingProxyType({})
+
+# Guard for debug lines whose arguments (segment/zone lists, raw params) are costly to build or repr
+_debug_enabled = partial(_LOGGER.isEnabledFor, logging.DEBUG)
+
+# Dreame state name -> Indigo status text
+_STATE_TEXT: Dict[str, str] = {
+    "AUTO_CLEANING": "Cleaning",
+    "CLEANING": "Cleaning",
+    "ZONE_CLEANING": "Zone cleaning",
+    "SEGMENT_CLEANING": "Room cleaning",
+    "BACK_HOME": "Returning to dock",
+    "DOCKED": "Docked",
+    "IDLE": "Idle",
+    "PAUSED": "Paused",
+    "STANDBY": "Standby",
+    "ERROR": "Error",
+}
+
+# (enum type, enum member) -> title-cased name; keyed by type so IntEnums with equal values don't collide
+_TITLE_CACHE: Dict[Any, str] = {}
+
+
+def _enum_title(value: Any) -> str:
+    """
+    Title-cased enum name (cached per member), or str(value) for non-enums.
+    """
+    if not hasattr(value, "name"):
+        return str(value)
+    key = (type(value), value)
+    title = _TITLE_CACHE.get(key)
+    if title is None:
+        title = _TITLE_CACHE[key] = value.name.title()
+    return title
+
+
+@lru_cache(maxsize=64)
+def _state_text(state_str: str) -> str:
+    """
+    Indigo status text for a Dreame state name; memoized since the set of states is small.
+    """
+    return _STATE_TEXT.get(state_str.upper(), state_str.title())
+
+
+@dataclass(slots=True)
 class DreameStatus:
     state: str
     state_text: str
     battery: int
     fan_speed: str
-    fan_modes: List[str]
+    fan_modes: Tuple[str, ...]
     area_m2: float
     duration_min: int
     is_charging: bool
@@ -29,6 +103,14 @@ class DreameStatus:
     error_text: Optional[str] = None
 
 
+@dataclass
+class _Command:
+    """A queued device command and the future its caller(s) await."""
+    func: Any
+    args: Tuple
+    future: asyncio.Future
+
+
 class AsyncDreameClient:
     def __init__(
         self,
@@ -44,6 +126,8 @@ class AsyncDreameClient:
         device_id: Optional[str] = None,
         auth_key: Optional[str] = None,
         account_type: Optional[str] = "dreame",
+        status_ttl: float = 3.0,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT,
     ) -> None:
         self._loop = loop
         self._name = name or "Dreame Vacuum"
@@ -69,6 +153,7 @@ class AsyncDreameClient:
         self._country = (country or "eu").strip().lower()
         self._prefer_cloud = bool(prefer_cloud)
         self._device_id = str(device_id).strip() if device_id else None
+        self._call_timeout = float(call_timeout)
         self._auth_key = auth_key
         self._account_type = at
 
@@ -76,6 +161,39 @@ class AsyncDreameClient:
         self._device: Optional[DreameVacuumDevice] = None
         self._connected: bool = False
 
+        # One worker per device: a robot handles one request at a time, so this serializes
+        # calls to it (no protocol races) without queuing behind other devices' I/O
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # Separate single thread for map rendering (CPU-bound PIL/PNG work)
+        self._render_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+        # In-flight idempotent reads, keyed by name; concurrent callers share one device round-trip
+        self._inflight: Dict[Any, asyncio.Task] = {}
+
+        # Last DreameStatus and when it was fetched (loop.time()); reused for status_ttl seconds
+        self._status_ttl = max(0.0, float(status_ttl or 0.0))
+        self._status_cache: Optional[Tuple[float, DreameStatus]] = None
+        # Bumped when a command is queued and when it finishes; a status fetch that started under
+        # an older value may predate the command, so its result is returned but not cached
+        self._cmd_gen = 0
+
+        # status.attributes as of the last fetch; the lib rebuilds that dict on every access
+        self._status_attrs: Mapping[str, Any] = _EMPTY_ATTRS
+
+        # Device commands run one at a time from this queue (created on first command)
+        self._cmd_q: Optional[asyncio.Queue] = None
+        self._cmd_worker: Optional[asyncio.Task] = None
+        # Last queued command not yet picked up; an identical follow-up shares its result
+        self._cmd_tail: Optional[_Command] = None
+
+        # loop.time() before which reads fail fast instead of queueing behind a dead device
+        self._backoff_until: float = 0.0
+
+        # Shortcut IDs the device reports; refreshed with every status fetch (None = not read yet)
+        self._shortcut_ids: Optional[frozenset] = None
+        # Raw 'shortcuts' keys _shortcut_ids was built from; unchanged keys => nothing to rebuild
+        self._shortcut_keys: Optional[frozenset] = None
+
         _LOGGER.debug(
             "AsyncDreameClient.__init__: name=%s host=%r token_len=%s mac=%r "
             "user_set=%s country=%r prefer_cloud=%s device_id=%r account_type=%r",
@@ -90,11 +208,64 @@ class AsyncDreameClient:
             self._account_type,
         )
 
-    async def _run(self, func, *args, **kwargs):
+    async def _run(self, func, *args, timeout: Optional[float] = None):
+        """
+        Run blocking dreame.* call on this client's single worker thread.
+        Gives up after timeout (default call_timeout) seconds with DeviceException; the
+        worker thread itself can't be interrupted, but only this device waits behind it.
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"dreame-{self._device_id or self._host or id(self)}"
+            )
+        try:
+            return await asyncio.wait_for(
+                self._loop.run_in_executor(self._executor, partial(func, *args)),
+                timeout or self._call_timeout,
+            )
+        except asyncio.TimeoutError as ex:
+            raise DeviceException(
+                f"{getattr(func, '__name__', func)} timed out after {timeout or self._call_timeout:.0f}s"
+            ) from ex
+
+    async def _run_render(self, func, *args, **kwargs):
+        """
+        Run a blocking map fetch/render/encode on this client's render thread, so a
+        multi-second render doesn't hold up status polls and commands on the device worker.
+        """
+        if self._render_executor is None:
+            self._render_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"dreame-render-{self._device_id or self._host or id(self)}"
+            )
+        return await self._loop.run_in_executor(self._render_executor, partial(func, *args, **kwargs))
+
+    async def _run_retry(self, func, *args, max_retries: int = 4):
         """
-        Run blocking dreame.* call in Indigo's async executor.
+        _run() for idempotent reads, retrying DeviceException (transport errors) with
+        exponential backoff and jitter. Anything else (auth, bad values) raises at once.
+        While a backoff is pending, other callers get RuntimeError instead of piling up.
         """
-        return await self._loop.run_in_executor(None, lambda: func(*args, **kwargs))
+        if self._loop.time() < self._backoff_until:
+            raise RuntimeError("Device offline, backing off")
+
+        attempt = 0
+        while True:
+            try:
+                result = await self._run(func, *args)
+            except DeviceException as ex:
+                delay = min(_RETRY_BASE * (2 ** attempt), _RETRY_CAP) + random.uniform(0, _RETRY_JITTER)
+                self._backoff_until = self._loop.time() + delay
+                if attempt >= max_retries:
+                    raise
+                attempt += 1
+                _LOGGER.debug(
+                    "%s failed (%s); retry %d/%d in %.1fs",
+                    getattr(func, "__name__", func), ex, attempt, max_retries, delay,
+                )
+                await asyncio.sleep(delay)
+            else:
+                self._backoff_until = 0.0
+                return result
 
     async def connect(self) -> None:
         """
@@ -178,8 +349,9 @@ class AsyncDreameClient:
 
         # Now call connect() which internally uses local or cloud as appropriate
         try:
-            info = await self._run(self._protocol.connect, None, None, 3)
-            _LOGGER.debug("DreameVacuumProtocol.connect returned: %r", info)
+            info = await self._run_retry(self._protocol.connect, None, None, 3)
+            if _debug_enabled():
+                _LOGGER.debug("DreameVacuumProtocol.connect returned: %r", info)
 
         except DeviceException as ex:
             _LOGGER.error("Dreame protocol connect failed: %s", ex)
@@ -233,21 +405,85 @@ class AsyncDreameClient:
 
     async def disconnect(self) -> None:
         self._connected = False
+        if self._cmd_worker is not None:
+            self._cmd_worker.cancel()
+            self._cmd_worker = None
+        if self._cmd_q is not None:
+            # Fail anything still waiting rather than leave callers hanging
+            while not self._cmd_q.empty():
+                cmd = self._cmd_q.get_nowait()
+                if not cmd.future.done():
+                    cmd.future.set_exception(RuntimeError("Disconnected"))
+            self._cmd_q = None
+            self._cmd_tail = None
         if self._protocol is not None:
             try:
                 await self._run(self._protocol.disconnect)
             except Exception:
                 pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._render_executor is not None:
+            self._render_executor.shutdown(wait=False)
+            self._render_executor = None
+
+    async def _coalesce(self, key: Any, factory):
+        """
+        Run factory() once for all concurrent callers using the same key.
+        Only for idempotent reads - never for commands that change device state.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._loop.create_task(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        # shield: one caller being cancelled must not cancel the shared request
+        return await asyncio.shield(task)
+
+    def set_status_ttl(self, seconds: float) -> None:
+        """
+        Change how long a fetched DreameStatus is reused (0 disables caching).
+        """
+        self._status_ttl = max(0.0, float(seconds or 0.0))
+        self._status_cache = None
 
     async def get_status(self) -> DreameStatus:
         """
         Update DreameVacuumDevice and map its status -> DreameStatus.
+        Overlapping calls (poll loop + action refresh) share a single update, and a
+        result younger than status_ttl seconds is returned without touching the device.
+        """
+        cached = self._status_cache
+        if cached is not None and self._loop.time() - cached[0] < self._status_ttl:
+            return cached[1]
+        return await self._coalesce("status", self._fetch_status)
+
+    @property
+    def status_attrs(self) -> Mapping[str, Any]:
         """
+        DreameVacuumDevice.status.attributes captured by the last status fetch (read-only use).
+        """
+        return self._status_attrs
+
+    async def _fetch_status(self) -> DreameStatus:
         if not self._device:
             raise RuntimeError("Dreame client not connected")
 
+        gen = self._cmd_gen
         _LOGGER.debug("AsyncDreameClient.get_status(): calling DreameVacuumDevice.update()")
-        await self._run(self._device.update)
+        await self._run_retry(self._device.update)
+        # Build the snapshot on the device worker too: the property walk over the lib's
+        # status object is pure Python and shouldn't run on the event loop
+        status = await self._run(self._build_status)
+        if self._cmd_gen == gen:
+            self._status_cache = (self._loop.time(), status)
+        return status
+
+    def _build_status(self) -> DreameStatus:
+        """
+        Map DreameVacuumDevice.status -> DreameStatus (blocking; runs in the executor).
+        """
         s = self._device.status
 
         raw_state = getattr(s, "status", None) or getattr(s, "state", None)
@@ -256,39 +492,20 @@ class AsyncDreameClient:
         else:
             state_str = str(raw_state) if raw_state is not None else "UNKNOWN"
 
-        mapping = {
-            "AUTO_CLEANING": "Cleaning",
-            "CLEANING": "Cleaning",
-            "ZONE_CLEANING": "Zone cleaning",
-            "SEGMENT_CLEANING": "Room cleaning",
-            "BACK_HOME": "Returning to dock",
-            "DOCKED": "Docked",
-            "IDLE": "Idle",
-            "PAUSED": "Paused",
-            "STANDBY": "Standby",
-            "ERROR": "Error",
-        }
-        state_text = mapping.get(state_str.upper(), state_str.title())
+        state_text = _state_text(state_str)
 
         battery = int(getattr(s, "battery_level", 0) or 0)
 
         suction_enum = getattr(s, "suction_level", None)
-        if hasattr(suction_enum, "name"):
-            fan_speed = suction_enum.name.title()
-        else:
-            fan_speed = str(suction_enum) if suction_enum is not None else ""
+        fan_speed = _enum_title(suction_enum) if suction_enum is not None else ""
 
-        fan_modes: List[str] = []
         levels = getattr(s, "suction_levels", None)
-        if isinstance(levels, dict):
-            for v in levels.values():
-                if hasattr(v, "name"):
-                    fan_modes.append(v.name.title())
-                else:
-                    fan_modes.append(str(v))
+        fan_modes = tuple(map(_enum_title, levels.values())) if isinstance(levels, dict) else ()
 
         # --- Area / duration: prefer direct attributes, else fall back to attributes dict ---
-        attrs = getattr(s, "attributes", None) or {}
+        attrs = getattr(s, "attributes", None) or _EMPTY_ATTRS
+        self._status_attrs = attrs
+        self._refresh_shortcut_ids(attrs)
 
         raw_area = getattr(s, "cleaned_area", None)
         if raw_area is None:
@@ -342,13 +559,89 @@ class AsyncDreameClient:
             error_text=error_text,
         )
 
+    def _refresh_shortcut_ids(self, attrs) -> frozenset:
+        """
+        Update _shortcut_ids (int-normalized) from a status attributes dict, whose
+        'shortcuts' is keyed by ID. The set is only rebuilt when the keys change.
+        """
+        keys = frozenset(attrs.get("shortcuts") or ())
+        if keys != self._shortcut_keys or self._shortcut_ids is None:
+            ids = set()
+            for key in keys:
+                try:
+                    ids.add(int(key))
+                except (TypeError, ValueError):
+                    pass
+            self._shortcut_keys = keys
+            self._shortcut_ids = frozenset(ids)
+        return self._shortcut_ids
+
     # ========= Commands =========
 
+    async def _run_command(self, func, *args):
+        """
+        Queue a device command and wait for its result. Commands run one at a time in
+        order; an idempotent command (_IDEMPOTENT_COMMANDS) sent again while the same one is
+        still waiting to run (e.g. a double-clicked pause) is not queued twice - both callers share it.
+        """
+        self._status_cache = None
+        self._cmd_gen += 1
+
+        tail = self._cmd_tail
+        if (
+            tail is not None
+            and tail.func == func
+            and tail.args == args
+            and getattr(func, "__name__", None) in _IDEMPOTENT_COMMANDS
+        ):
+            return await asyncio.shield(tail.future)
+
+        if self._cmd_q is None:
+            self._cmd_q = asyncio.Queue(maxsize=_CMD_QUEUE_MAX)
+        if self._cmd_worker is None or self._cmd_worker.done():
+            self._cmd_worker = self._loop.create_task(self._command_worker())
+
+        cmd = _Command(func, args, self._loop.create_future())
+        try:
+            self._cmd_q.put_nowait(cmd)
+        except asyncio.QueueFull:
+            raise RuntimeError("Device busy: too many queued commands") from None
+        self._cmd_tail = cmd
+        # shield: a cancelled caller doesn't pull a command that is already queued
+        return await asyncio.shield(cmd.future)
+
+    async def _command_worker(self) -> None:
+        """
+        Consumer for _cmd_q: runs each command on the device worker and resolves its future.
+        """
+        q = self._cmd_q
+        while True:
+            cmd = await q.get()
+            if cmd is self._cmd_tail:
+                self._cmd_tail = None
+            try:
+                result = await self._run(cmd.func, *cmd.args)
+            except asyncio.CancelledError:
+                if not cmd.future.done():
+                    cmd.future.set_exception(RuntimeError("Disconnected"))
+                raise
+            except Exception as ex:
+                if not cmd.future.done():
+                    cmd.future.set_exception(ex)
+            else:
+                if not cmd.future.done():
+                    cmd.future.set_result(result)
+            finally:
+                # Drop any status read while the command was in flight (and keep later-finishing ones out)
+                self._status_cache = None
+                self._cmd_gen += 1
+                q.task_done()
+
     async def start_cleaning(self) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("start_cleaning() called")
-        await self._run(self._device.start)
+        await self._run_command(self._device.start)
 
     async def start_shortcut(self, shortcut_id) -> None:
         """
@@ -364,32 +657,24 @@ class AsyncDreameClient:
             raise RuntimeError("Not connected")
 
         # Normalize to int if possible
-        sid_int = None
-        if isinstance(shortcut_id, int):
-            sid_int = shortcut_id
-        else:
-            try:
-                sid_int = int(str(shortcut_id).strip())
-            except Exception:
-                sid_int = None
-
-        # Try to validate against current shortcuts
-        shortcuts_attr = None
         try:
-            s = self._device.status
-            attrs = getattr(s, "attributes", None) or {}
-            shortcuts_attr = attrs.get("shortcuts") or {}
-        except Exception:
-            shortcuts_attr = {}
+            sid_int = shortcut_id if type(shortcut_id) is int else int(str(shortcut_id).strip())
+        except (TypeError, ValueError):
+            sid_int = None
+
+        # Try to validate against the shortcuts seen on the last status fetch
+        known = self._shortcut_ids
+        if known is None:
+            known = self._refresh_shortcut_ids(self._status_attrs)
 
-        if shortcuts_attr and sid_int is not None and sid_int not in shortcuts_attr:
+        if known and sid_int is not None and sid_int not in known:
             raise ValueError(f"Invalid shortcut ID: {shortcut_id!r} (not in device shortcuts)")
 
         _LOGGER.debug("AsyncDreameClient.start_shortcut(id=%r) called", sid_int or shortcut_id)
 
         # Dreame library expects an int id
         try:
-            await self._run(self._device.start_shortcut, sid_int if sid_int is not None else shortcut_id)
+            await self._run_command(self._device.start_shortcut, sid_int if sid_int is not None else shortcut_id)
             _LOGGER.debug("AsyncDreameClient.start_shortcut(%r) completed OK", sid_int or shortcut_id)
         except Exception as exc:
             _LOGGER.error("AsyncDreameClient.start_shortcut(%r) failed: %s", sid_int or shortcut_id, exc)
@@ -399,25 +684,25 @@ class AsyncDreameClient:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("start_washing() called")
-        await self._run(self._device.start_washing)
+        await self._run_command(self._device.start_washing)
 
     async def pause_washing(self) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("pause_washing() called")
-        await self._run(self._device.pause_washing)
+        await self._run_command(self._device.pause_washing)
 
     async def start_drying(self) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("start_drying() called")
-        await self._run(self._device.start_drying)
+        await self._run_command(self._device.start_drying)
 
     async def stop_drying(self) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("stop_drying() called")
-        await self._run(self._device.stop_drying)
+        await self._run_command(self._device.stop_drying)
 
     async def start_draining(self, clean_water_tank: bool = False) -> None:
         """
@@ -426,7 +711,7 @@ class AsyncDreameClient:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("start_draining(clean_water_tank=%r) called", clean_water_tank)
-        await self._run(self._device.start_draining, clean_water_tank)
+        await self._run_command(self._device.start_draining, clean_water_tank)
 
 
 ###
@@ -434,13 +719,13 @@ class AsyncDreameClient:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("stop_cleaning() called")
-        await self._run(self._device.stop)
+        await self._run_command(self._device.stop)
 
     async def pause(self) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("pause() called")
-        await self._run(self._device.pause)
+        await self._run_command(self._device.pause)
 
     async def start_pause(self) -> None:
         """
@@ -449,49 +734,52 @@ class AsyncDreameClient:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("start_pause() called")
-        await self._run(self._device.start_pause)
+        await self._run_command(self._device.start_pause)
 
     async def return_to_dock(self) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("return_to_dock() called")
-        await self._run(self._device.return_to_base)
+        await self._run_command(self._device.return_to_base)
 
     async def locate(self) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("locate() called")
-        await self._run(self._device.locate)
+        await self._run_command(self._device.locate)
 
     async def set_fan_speed(self, speed: str) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
         _LOGGER.debug("set_fan_speed(%s) called", speed)
-        await self._run(self._device.set_suction_level, speed)
+        await self._run_command(self._device.set_suction_level, speed)
 
     async def clean_segment(self, segments, repeats=1, suction_level="", water_volume="") -> None:
         if not self._device:
             raise RuntimeError("Not connected")
-        _LOGGER.debug(
-            "clean_segment(segments=%r, repeats=%r, suction_level=%r, water_volume=%r)",
-            segments,
-            repeats,
-            suction_level,
-            water_volume,
-        )
-        await self._run(self._device.clean_segment, segments, repeats, suction_level, water_volume)
+        if _debug_enabled():
+            _LOGGER.debug(
+                "clean_segment(segments=%r, repeats=%r, suction_level=%r, water_volume=%r)",
+                segments,
+                repeats,
+                suction_level,
+                water_volume,
+            )
+        await self._run_command(self._device.clean_segment, segments, repeats, suction_level, water_volume)
 
     async def clean_zone(self, zones, repeats=1) -> None:
         if not self._device:
             raise RuntimeError("Not connected")
-        _LOGGER.debug("clean_zone(zones=%r, repeats=%r) called", zones, repeats)
-        await self._run(self._device.clean_zone, zones, repeats)
+        if _debug_enabled():
+            _LOGGER.debug("clean_zone(zones=%r, repeats=%r) called", zones, repeats)
+        await self._run_command(self._device.clean_zone, zones, repeats)
 
     async def send_raw_command(self, method: str, params: Dict[str, Any]) -> Any:
         if not self._device:
             raise RuntimeError("Not connected")
-        _LOGGER.debug("send_raw_command(method=%r, params=%r)", method, params)
-        return await self._run(self._device.send_command, method, params)
+        if _debug_enabled():
+            _LOGGER.debug("send_raw_command(method=%r, params=%r)", method, params)
+        return await self._run_command(self._device.send_command, method, params)
 
     async def set_custom_cleaning(
         self,
@@ -512,20 +800,21 @@ class AsyncDreameClient:
         if not self._device:
             raise RuntimeError("Not connected")
 
-        _LOGGER.debug(
-            "set_custom_cleaning(segment_ids=%r, suction=%r, water=%r, repeats=%r, "
-            "cleaning_modes=%r, wetness=%r, routes=%r, custom_routes=%r)",
-            segment_ids,
-            suction_levels,
-            water_volumes,
-            repeats,
-            cleaning_modes,
-            wetness_levels,
-            cleaning_routes,
-            custom_mopping_routes,
-        )
+        if _debug_enabled():
+            _LOGGER.debug(
+                "set_custom_cleaning(segment_ids=%r, suction=%r, water=%r, repeats=%r, "
+                "cleaning_modes=%r, wetness=%r, routes=%r, custom_routes=%r)",
+                segment_ids,
+                suction_levels,
+                water_volumes,
+                repeats,
+                cleaning_modes,
+                wetness_levels,
+                cleaning_routes,
+                custom_mopping_routes,
+            )
 
-        await self._run(
+        await self._run_command(
             self._device.set_custom_cleaning,
             segment_ids,
             suction_levels,
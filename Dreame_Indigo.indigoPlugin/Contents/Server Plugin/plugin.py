@@ -11,25 +11,43 @@ from auto_installer import install_requirements_manual
 
 
 import asyncio
+import base64
+import json
 import threading
+import time
 import logging
 import logging.handlers
 import traceback
 import os
 import sys
 import platform
-from os import path
-from datetime import datetime
+import queue
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from dreame_client import AsyncDreameClient, DreameStatus
 from dreame.device import DreameVacuumDevice
 from dreame.protocol import DreameVacuumProtocol, DeviceException
+import dreame.resources as dreame_resources
 # Add near top of file with other imports
 from dreame_camera import DreameCameraHelper, DreameCameraConfig
-# add with other imports at the top
 
-import logging, traceback
-from dreame.protocol import DreameVacuumProtocol
+# Status polling cadence (seconds): fast while the robot/station is working,
+# otherwise back off from the idle interval up to the max while nothing changes.
+POLL_ACTIVE_SECONDS = 15.0
+POLL_IDLE_SECONDS = 30.0
+POLL_IDLE_MAX_SECONDS = 120.0
+# After a command wakes the poll loop: let the robot act on it this long, then poll
+POLL_WAKE_SETTLE_SECONDS = 2.0
+# Substrings of DreameStatus.state (upper-case enum name) that mean "working"
+_ACTIVE_STATE_WORDS = ("CLEAN", "SWEEP", "MOP", "RETURN", "BACK_HOME", "WASH", "DRY", "EMPT")
+_state_active = re.compile("|".join(_ACTIVE_STATE_WORDS)).search
+
+# Message-only formatter shared by the Indigo log handlers (IndigoLogHandler adds its own prefixes)
+_BARE_FMT = logging.Formatter("%(message)s")
+
 
 class IndigoLogHandler(logging.Handler):
     def __init__(self, display_name: str, level=logging.NOTSET, force_debug: bool = False):
@@ -39,61 +57,498 @@ class IndigoLogHandler(logging.Handler):
         self.force_debug = force_debug  # if True, always log at DEBUG to Indigo
 
     def emit(self, record):
+        # What level Indigo sees (force_debug maps everything to DEBUG); drop anything
+        # below this handler's level before any formatting work
+        levelno = logging.DEBUG if self.force_debug else record.levelno
+        if levelno < self.level:
+            return
+
         logmessage = ""
         is_error = False
-        # Original level from logger
-        orig_level = getattr(record, "levelno", logging.INFO)
-
-        # What level Indigo sees
-        levelno = logging.DEBUG if self.force_debug else orig_level
         try:
-            if self.level <= levelno:
-                is_exception = record.exc_info is not None
-
-                if levelno == 5 or levelno == logging.DEBUG:
-                    logmessage = "({}:{}:{}): {}".format(
-                        path.basename(record.pathname),
-                        record.funcName,
-                        record.lineno,
-                        record.getMessage(),
-                    )
-                elif levelno == logging.INFO:
-                    logmessage = record.getMessage()
-                elif levelno == logging.WARNING:
-                    logmessage = record.getMessage()
-                elif levelno == logging.ERROR:
-                    logmessage = "({}: Function: {}  line: {}):    Error :  Message : {}".format(
-                        path.basename(record.pathname),
-                        record.funcName,
-                        record.lineno,
-                        record.getMessage(),
-                    )
-                    is_error = True
-
-                if is_exception:
-                    logmessage = "({}: Function: {}  line: {}):    Exception :  Message : {}".format(
-                        path.basename(record.pathname),
-                        record.funcName,
-                        record.lineno,
-                        record.getMessage(),
-                    )
-                    indigo.server.log(message=logmessage, type=self.displayName, isError=is_error, level=levelno)
-                    etype, value, tb = record.exc_info
-                    tb_string = "".join(traceback.format_tb(tb))
-                    indigo.server.log(f"Traceback:\n{tb_string}", type=self.displayName, isError=is_error, level=levelno)
-                    indigo.server.log(f"Error in plugin execution:\n\n{traceback.format_exc(30)}",
-                                      type=self.displayName, isError=is_error, level=levelno)
-                    indigo.server.log(
-                        f"\nExc_info: {record.exc_info} \nExc_Text: {record.exc_text} \nStack_info: {record.stack_info}",
-                        type=self.displayName, isError=is_error, level=levelno,
-                    )
-                    return
-
+            is_exception = record.exc_info is not None
+
+            if levelno == 5 or levelno == logging.DEBUG:
+                logmessage = "({}:{}:{}): {}".format(
+                    record.filename,
+                    record.funcName,
+                    record.lineno,
+                    record.getMessage(),
+                )
+            elif levelno == logging.INFO:
+                logmessage = record.getMessage()
+            elif levelno == logging.WARNING:
+                logmessage = record.getMessage()
+            elif levelno == logging.ERROR:
+                logmessage = "({}: Function: {}  line: {}):    Error :  Message : {}".format(
+                    record.filename,
+                    record.funcName,
+                    record.lineno,
+                    record.getMessage(),
+                )
+                is_error = True
+
+            if is_exception:
+                logmessage = "({}: Function: {}  line: {}):    Exception :  Message : {}".format(
+                    record.filename,
+                    record.funcName,
+                    record.lineno,
+                    record.getMessage(),
+                )
                 indigo.server.log(message=logmessage, type=self.displayName, isError=is_error, level=levelno)
+                etype, value, tb = record.exc_info
+                tb_string = "".join(traceback.format_tb(tb))
+                indigo.server.log(f"Traceback:\n{tb_string}", type=self.displayName, isError=is_error, level=levelno)
+                indigo.server.log(f"Error in plugin execution:\n\n{traceback.format_exc(30)}",
+                                  type=self.displayName, isError=is_error, level=levelno)
+                indigo.server.log(
+                    f"\nExc_info: {record.exc_info} \nExc_Text: {record.exc_text} \nStack_info: {record.stack_info}",
+                    type=self.displayName, isError=is_error, level=levelno,
+                )
+                return
+
+            indigo.server.log(message=logmessage, type=self.displayName, isError=is_error, level=levelno)
         except Exception as ex:
             indigo.server.log(f"Error in Logging: {ex}", type=self.displayName, isError=True, level=logging.ERROR)
 
 
+# Devices.xml type id of the vacuum device
+VACUUM_TYPE_ID = "dreame_vacuum"
+
+# Initial values for the device states, written on every deviceStartComm
+_INITIAL_STATES = (
+    # Core summary
+    ("status", "Initializing"),
+    ("battery", 0),
+    ("fan_speed", ""),
+    ("area_cleaned_m2", 0.0),
+    ("duration_min", 0),
+    ("shortcuts", ""),
+    ("charging", False),
+    ("error_text", ""),
+    ("last_update", ""),
+
+    # Extended robot / dock / task states
+    ("robot_state", "Unknown"),
+    ("robot_state_detail", "Initializing"),
+    ("station_state", ""),
+    ("task_status", ""),
+    ("cleaning_mode", ""),
+
+    # Cleaning parameters
+    ("water_volume", 0),
+    ("mop_wetness_level", 0),
+    ("cleaning_progress", 0),
+
+    # Base / self-wash / drying
+    ("self_wash_base_status", ""),
+    ("drying_progress", 0),
+    ("auto_empty_status", ""),
+    ("station_drainage_status", ""),
+
+    # Combined / water temp
+    ("combined_status", "Initializing"),
+    ("water_temperature", ""),
+
+    # Consumables / health
+    ("main_brush_left", 0),
+    ("side_brush_left", 0),
+    ("filter_left", 0),
+    ("dirty_water_tank_left", 0),
+    ("scale_inhibitor_left", 0),
+
+    # AI / mapping capability summary
+    ("ai_obstacle_detection", False),
+    ("ai_pet_detection", False),
+
+    # Map / room metadata
+    ("map_list", ""),
+    ("current_map_id", 0),
+    ("multi_floor_map", False),
+    ("mapping_updates_enabled", False),  # replaced per device from enableMappingUpdates
+    ("selected_map", ""),
+    ("room_list", ""),
+    ("current_room", ""),
+    ("current_segment_id", 0),
+    ("cleaning_sequence", ""),
+
+    # Raw vacuum_state
+    ("vacuum_state", ""),
+
+    # Relay state
+    ("onOffState", False),
+)
+
+# deviceStartComm payload built once; only the mapping_updates_enabled entry varies per device
+_INITIAL_KV = tuple({"key": key, "value": value} for key, value in _INITIAL_STATES)
+_MAPPING_STATE_INDEX = next(
+    i for i, (key, _) in enumerate(_INITIAL_STATES) if key == "mapping_updates_enabled"
+)
+
+def _menu_value(raw) -> str:
+    """
+    Indigo menu value (a scalar, or a list whose first item is the value) -> stripped string or ''.
+    """
+    if isinstance(raw, (list, tuple)):
+        raw = raw[0] if raw else None
+    if raw is None:
+        return ""
+    return str(raw).strip()
+
+
+def _prop_str(props, key: str) -> str | None:
+    """
+    Text prop -> stripped string, or None when missing/blank.
+    """
+    value = props.get(key)
+    return (value.strip() or None) if isinstance(value, str) else None
+
+
+def _parse_int(raw, default: int | None = None) -> int | None:
+    """
+    Action field -> int, or default when missing/blank/not a number.
+    """
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_int_list(raw: str) -> list[int] | None:
+    """
+    Comma-separated ids ('2, 3,5') -> [2, 3, 5]; blank items are skipped, None if any item is not a number.
+    """
+    try:
+        return [int(v) for v in raw.split(",") if v.strip()]
+    except ValueError:
+        return None
+
+
+def _attr_or_status(attrs, status, name: str):
+    """
+    Status attribute by name, falling back to the status object's attribute (or None).
+    The attributes dict usually has it, so the getattr fallback is only paid on a miss.
+    """
+    try:
+        return attrs[name]
+    except KeyError:
+        return getattr(status, name, None)
+
+
+@lru_cache(maxsize=32)
+def _account_type_from_str(value: str) -> str:
+    return value.strip().lower() or "dreame"
+
+
+@lru_cache(maxsize=64)
+def _shortcut_id(raw: str) -> int | str:
+    """
+    Shortcut id from a menu/prop string -> int when numeric (Dreame/Mova ids), else the raw string.
+    """
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return raw
+
+
+# export_map_resources: only likely image/icon/font constants are considered
+_RESOURCE_KEYWORDS = ("IMAGE", "ICON", "MAP_FONT", "DEFAULT_MAP")
+
+
+@lru_cache(maxsize=1)
+def _resource_names() -> tuple[str, ...]:
+    """
+    Names of the exportable dreame.resources constants, filtered once.
+    """
+    return tuple(
+        name for name in vars(dreame_resources)
+        if name.isupper() and any(k in name for k in _RESOURCE_KEYWORDS)
+    )
+
+
+def _decoded_resource(name: str) -> tuple[bytes, str, bool] | None:
+    """
+    dreame.resources constant -> (payload, extension, gzip/zlib-compressed), or None if it isn't decodable.
+    Not cached: each asset is written once per export, so keeping the decoded blobs would only pin memory.
+    Compressed payloads are inflated while writing (see _write_resource).
+    """
+    value = vars(dreame_resources).get(name)
+    if not isinstance(value, str):
+        return None
+
+    # Determine extension: font vs PNG
+    ext = ".ttf" if name.startswith("MAP_FONT") else ".png"
+
+    # Some assets may be raw PNG base64, some may be gzipped+base64
+    try:
+        b = base64.b64decode(value, validate=False)
+    except Exception:
+        # Not base64, skip
+        return None
+
+    # crude PNG header check: raw PNG; anything else is maybe gzip-wrapped png, or font
+    return b, ext, not (ext == ".png" and b.startswith(b"\x89PNG\r\n\x1a\n"))
+
+
+_INFLATE_CHUNK = 64 * 1024
+
+
+def _write_all(fd: int, data) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _write_resource(out_path: str, payload: bytes, compressed: bool) -> None:
+    """
+    Write an exported resource with unbuffered os.write; compressed payloads are inflated in chunks.
+    Raises zlib.error if a compressed payload turns out not to be gzip/zlib data, or is truncated.
+    """
+    fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if not compressed:
+            _write_all(fd, payload)
+            return
+        inflater = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        with memoryview(payload) as view:
+            for start in range(0, len(view), _INFLATE_CHUNK):
+                _write_all(fd, inflater.decompress(view[start:start + _INFLATE_CHUNK]))
+        _write_all(fd, inflater.flush())
+        if not inflater.eof:
+            # zlib.decompress() would have raised here; keep the caller's fallback/skip path working
+            raise zlib.error("incomplete or truncated stream")
+    finally:
+        os.close(fd)
+
+
+# 'id:name, id:name, ...' state strings -> [(id, name), ...] in one pass: each comma-separated item
+# with a non-blank id and name (split at the first ':', both stripped); other items are skipped
+_menu_item_pairs = re.compile(r"(?<![^,])\s*([^:,\s][^:,]*?)\s*:\s*([^,\s][^,]*?)\s*(?=,|$)").findall
+
+# clean_zones: one 'x1,y1,x2,y2' rectangle
+_ZONE_RE = re.compile(r"\s*([-+]?\d+)\s*,\s*([-+]?\d+)\s*,\s*([-+]?\d+)\s*,\s*([-+]?\d+)\s*")
+
+
+@lru_cache(maxsize=16)
+def _shortcut_menu_items(raw: str) -> tuple[tuple[str, str], ...]:
+    """
+    'shortcuts' state ('id:name, id:name, ...') -> ((id, 'name (id)'), ...) menu items.
+    Cached per raw string: the state rarely changes between dialog opens.
+    """
+    # Non-numeric ids are still allowed as string ids
+    return tuple((sid_str, f"{name} ({sid_str})") for sid_str, name in _menu_item_pairs(raw))
+
+
+@lru_cache(maxsize=16)
+def _room_menu_items(raw: str) -> tuple[tuple[str, str], ...]:
+    """
+    'room_list' state ('id:name, id:name, ...') -> ((id, 'name (id)'), ...) menu items.
+    Raises ValueError on a non-numeric id, so we don't hand garbage to the action. Cached per raw string.
+    """
+    items = []
+    for sid_str, name in _menu_item_pairs(raw):
+        int(sid_str)
+        items.append((sid_str, f"{name} ({sid_str})"))
+    return tuple(items)
+
+
+@lru_cache(maxsize=1)
+def _device_info_models() -> dict[str, int]:
+    """
+    Decoded DEVICE_INFO model map (see Plugin._load_models_from_device_info). DEVICE_INFO is a
+    module constant, so the base64/zlib/json decode runs once rather than on every cloud connect.
+    Shared result: callers only read it.
+    """
+    from dreame.const import DEVICE_INFO  # or wherever DEVICE_INFO lives in your vendored dreame
+
+    models: dict[str, int] = {}
+    device_info = json.loads(
+        zlib.decompress(base64.b64decode(DEVICE_INFO), zlib.MAX_WBITS | 32)
+    )
+    # device_info[3]: model keys; device_info[0]: info indexed by that mapping
+    for k in device_info[3]:
+        info = device_info[0][device_info[3][k]]
+        if info:
+            # info[0] == 1 → Xiaomi, 2 → Mova, else Dreame (mirrors HA)
+            vendor_prefix = (
+                "xiaomi"
+                if info[0] == 1
+                else "mova"
+                if info[0] == 2
+                else "dreame"
+            )
+            models[f"{vendor_prefix}.vacuum.{k}"] = info[1]
+    return models
+
+
+def _normalize_account_type(raw) -> str:
+    """
+    accountType menu value ('dreame', 'mihome', 'mova', possibly list-wrapped) -> lower-case string, default 'dreame'.
+    """
+    if isinstance(raw, (list, tuple)):
+        raw = raw[0] if raw else None
+    if raw is None:
+        return "dreame"
+    return _account_type_from_str(str(raw))
+
+
+def _room_name(rooms_map, selected_map, segment_id) -> str | None:
+    """
+    Name of room segment_id on the selected map (the first map if that one isn't listed), or None.
+    attributes['rooms'] is {map name: [{'id': .., 'name': ..}, ...]}; the first matching room wins.
+    """
+    if isinstance(segment_id, dict):
+        # Just in case some models use a dict here
+        segment_id = segment_id.get("id") or segment_id.get("segment_id")
+    if segment_id is None or not isinstance(rooms_map, dict) or not rooms_map:
+        return None
+    try:
+        seg = int(segment_id)
+        sel_map = selected_map if selected_map in rooms_map else next(iter(rooms_map))
+        for room in rooms_map.get(sel_map) or ():
+            rid = room.get("id")
+            nm = room.get("name")
+            if rid is not None and nm and int(rid) == seg:
+                return nm
+    except (TypeError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def _auth_account(username: str | None, country: str, account_type: str) -> str:
+    """
+    Login an authKey was issued for (stored as authKeyAccount); a stored key is only reused for the same one.
+    """
+    return f"{account_type}|{country}|{(username or '').strip()}"
+
+
+# Device props that make the vacuum behave as a relay (on/off) device in Indigo
+_RELAY_PROPS = (
+    ("SupportsSensorValue", True),
+    ("SupportsOnState", True),
+    ("AllowSensorValueChange", False),
+    ("AllowOnStateChange", True),
+    ("SupportsStatusRequest", False),
+)
+
+# Combined status: DreameStatus.state values (upper-case) that read as "Returning to dock"
+_RETURNING_STATES = frozenset({"BACK_HOME", "RETURNING"})
+
+# Combined status: keywords of vacuum_state / status text that pick the verb (see _async_refresh_state)
+_verb_words = re.compile("mopp|sweep|clean|return|charging|washing|drying|docked|paused|idle").findall
+
+# Combined status sentence forms for the fixed verbs; _verb_form classifies anything else
+_VERB_FORMS = {
+    "Charging": "battery",
+    "Returning to dock": "battery",
+    "Washing mop": "plain",
+    "Drying mop": "plain",
+    "Cleaning": "cleaning",
+    "Mopping": "cleaning",
+    "Sweeping and mopping": "cleaning",
+}
+
+
+@lru_cache(maxsize=64)
+def _verb_form(verb: str) -> str:
+    """
+    Combined status verb -> sentence form: 'battery', 'plain', 'cleaning' or 'other'.
+    Fixed verbs are a dict hit; free-text state_text verbs are classified by keyword once and cached.
+    """
+    form = _VERB_FORMS.get(verb)
+    if form is not None:
+        return form
+    verb_l = verb.lower()
+    if "charging" in verb_l or verb.startswith("Returning"):
+        return "battery"
+    if "washing mop" in verb_l or "drying mop" in verb_l:
+        return "plain"
+    if "clean" in verb_l or "mopp" in verb_l:
+        return "cleaning"
+    return "other"
+
+
+# Relay Toggle: a status text matching this means "cleaning" (so toggle docks)
+_toggle_active = re.compile("clean|zone|segment").search
+# Map polling fallback: a (lower-case) status text matching this means the map is changing
+_status_text_active = re.compile("clean|mopp|wash|return|spot").search
+
+# Startup banner rules
+_BANNER_START = "{0:=^100}".format("⚪️ Initializing Dreame Vacuum ⚪️")
+_BANNER_END = "{0:=^100}".format("🤖🤖🤖 End Initializing 🤖🤖🤖")
+
+# Library loggers routed to the plugin log file: (name, Indigo-eligible).
+# Indigo-eligible loggers run at DEBUG and also go to Indigo when showDebugInfo is on;
+# the HTTP libs stay file-only at WARNING to avoid spam.
+_LIBRARY_LOGGERS = (
+    ("dreame_client", True),
+    ("dreame_camera", True),
+    ("dreame", True),
+    ("miio", True),
+    ("urllib3", False),
+    ("requests", False),
+)
+
+# Device pluginProps the plugin writes for its own bookkeeping; changing these must not restart comm
+_SESSION_PROPS = frozenset({"authKey", "authKeyAccount", "dreameLoginInfo"})
+
+# validateDeviceConfigUi: (field, error) pairs that must be non-blank for each login mode
+_REQUIRED_CLOUD_FIELDS = (
+    ("username", "Username / email is required for cloud mode."),
+    ("password", "Password is required for cloud mode."),
+    ("country", "Country code is required for cloud mode."),
+)
+_REQUIRED_LOCAL_FIELDS = (
+    ("host", "Local IP/host is required for local mode."),
+    ("token", "Local device token is required for local mode."),
+)
+
+def _nonblank_str(value) -> str | None:
+    value = str(value).strip()
+    return value or None
+
+
+# _async_refresh_state: status attributes copied to the same-named state, with their converter
+# (a converter returning None, or raising, leaves the state untouched)
+_ATTR_STATE_FIELDS = (
+    # Lifetime totals
+    ("total_cleaned_area", float),
+    ("total_cleaning_time", int),
+    ("cleaning_count", int),
+    # Current run counters
+    ("cleaned_area", float),
+    ("cleaning_time", int),
+    ("cleaning_progress", int),  # %
+    # Live vacuum_state: 'mopping', 'drying', 'washing', etc.
+    ("vacuum_state", str),
+    # "Cleaning mode" here is a configuration (Sweeping/Mopping/etc.), not live state
+    ("cleaning_mode", str),
+    # Useful config / mode states
+    ("suction_level", _nonblank_str),
+    ("washing_mode", _nonblank_str),
+    ("mop_pad_humidity", _nonblank_str),
+    ("auto_empty_mode", _nonblank_str),
+    ("water_temperature", str),  # Normal/Mild/Warm/Hot
+    # Station / tank / consumables status
+    ("clean_water_tank_status", _nonblank_str),
+    ("dirty_water_tank_status", _nonblank_str),
+    ("dust_bag_status", _nonblank_str),
+    ("detergent_status", _nonblank_str),
+    ("auto_empty_status", str),
+    ("station_drainage_status", str),
+    # Scheduling / off-peak
+    ("scheduled_clean", bool),
+    ("off_peak_charging", bool),
+    ("off_peak_charging_start", _nonblank_str),
+    ("off_peak_charging_end", _nonblank_str),
+    # Drying setting
+    ("drying_time", int),
+)
+
+# (client class, method name) -> whether it is an async method; see _async_call_client_wash_action
+_COROFN_CACHE: dict[tuple[type, str], bool] = {}
+
+
 class Plugin(indigo.PluginBase):
     ########################################
     def __init__(
@@ -110,21 +565,36 @@ class Plugin(indigo.PluginBase):
         self._event_loop: asyncio.AbstractEventLoop | None = None
         self._async_thread: threading.Thread | None = None
         self.stopThread: bool = False
+        # Set (on the loop) by shutdown(); _async_stop waits on it
+        self._stop_event: asyncio.Event | None = None
+        # Strong refs to fire-and-forget tasks from _submit (the loop only keeps weak ones)
+        self._bg_tasks: set[asyncio.Task] = set()
 
         # Per-device clients and poll tasks
         self._clients: dict[int, AsyncDreameClient] = {}
+        # (one task per device: the status poll also drives map updates)
         self._poll_tasks: dict[int, asyncio.Task] = {}
-        # inside Plugin.__init__ after other instance attributes
-        # Per-device map poll tasks
-        self._map_tasks: dict[int, asyncio.Task] = {}
+        # Per-device events that wake the poll loop early (set after commands)
+        self._poll_wake: dict[int, asyncio.Event] = {}
+        # Per-device map render helpers, kept so unchanged maps are not re-rendered: (dev_id, wifi) -> (device, helper)
+        self._camera_helpers: dict[tuple[int, bool], tuple[DreameVacuumDevice, DreameCameraHelper]] = {}
+        # Per-device state values last pushed to the server; polls only send what differs from these
+        self._last_states: dict[int, dict[str, object]] = {}
+        # Per-device last combined status: (inputs it was built from, sentence); unchanged inputs reuse it
+        self._combined_status: dict[int, tuple[tuple, str]] = {}
+        # Blocking cloud calls (login, device lookup) run here rather than on the loop's default pool
+        self._cloud_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dreame-cloud")
+        # Relay OFF mapping (relayOffAction) -> (log text, coroutine); unknown values dock
+        self._relay_off_dispatch = {
+            "pause": ("pause cleaning", self._async_pause_clean),
+            "stop": ("stop cleaning", self._async_stop_clean),
+            "dock": ("return to dock", self._async_return_to_dock),
+        }
 
         # --- Logging setup (DeviceTimer / EVSE style, but quieter for libs) ---
         if hasattr(self, "indigo_log_handler") and self.indigo_log_handler:
             self.logger.removeHandler(self.indigo_log_handler)
 
-        # Collect everything at logger; handlers filter
-        self.logger.setLevel(logging.DEBUG)
-
         try:
             self.logLevel = int(self.pluginPrefs.get("showDebugLevel", logging.INFO))
             self.fileloglevel = int(self.pluginPrefs.get("showDebugFileLevel", logging.DEBUG))
@@ -132,11 +602,19 @@ class Plugin(indigo.PluginBase):
             self.logLevel = logging.INFO
             self.fileloglevel = logging.DEBUG
 
+        # Collect at the lowest level any handler wants; handlers filter further
+        self._apply_logger_level()
+
+        try:
+            self.status_cache_seconds = float(self.pluginPrefs.get("statusCacheSeconds", 3))
+        except Exception:
+            self.status_cache_seconds = 3.0
+
         # Indigo log handler
         # Indigo handler for plugin messages (respects user-selected level)
         try:
             self.indigo_log_handler = IndigoLogHandler(plugin_display_name, level=self.logLevel, force_debug=False)
-            self.indigo_log_handler.setFormatter(logging.Formatter("%(message)s"))
+            self.indigo_log_handler.setFormatter(_BARE_FMT)
             self.logger.addHandler(self.indigo_log_handler)
         except Exception as exc:
             indigo.server.log(f"Failed to create IndigoLogHandler: {exc}", isError=True)
@@ -150,8 +628,18 @@ class Plugin(indigo.PluginBase):
         except Exception as exc:
             self.logger.exception(exc)
 
+        # Library loggers reach the file through a queue: their (chatty) DEBUG calls, often made
+        # on the event loop, just enqueue; the listener thread (started in startup) does the disk writes
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(self._log_queue)
+        self._queue_listener = logging.handlers.QueueListener(
+            self._log_queue, self.plugin_file_handler, respect_handler_level=True
+        )
+
         # Route library logging: full DEBUG to file, INFO+ optionally to Indigo
         # Route library logging: always to file; optionally to Indigo at DEBUG when showDebugInfo is True
+        # (_lib_wiring is the (showDebugInfo, file level) the loggers are currently wired for)
+        self._lib_wiring: tuple[bool, int] | None = None
         try:
             root_logger = logging.getLogger()
             if self.plugin_file_handler not in root_logger.handlers:
@@ -159,39 +647,11 @@ class Plugin(indigo.PluginBase):
             if root_logger.level > logging.DEBUG:
                 root_logger.setLevel(logging.DEBUG)
 
-            # Check pref: do we want library logs in Indigo?
-            show_lib_debug = bool(self.pluginPrefs.get("showDebugInfo", False))
-
-            lib_indigo_handler = None
-            if show_lib_debug:
-                # All library logs will appear as DEBUG in Indigo
-                lib_indigo_handler = IndigoLogHandler(plugin_display_name, level=logging.DEBUG, force_debug=True)
-                lib_indigo_handler.setFormatter(logging.Formatter("%(message)s"))
-
-            def _wire_logger(name: str, to_indigo: bool):
-                lg = logging.getLogger(name)
-                lg.setLevel(logging.DEBUG)
-                lg.handlers[:] = []
-                lg.addHandler(self.plugin_file_handler)
-                if to_indigo and lib_indigo_handler:
-                    lg.addHandler(lib_indigo_handler)
-                lg.propagate = False
-
-            # Dreame family: always to file; to Indigo only when showDebugInfo is True
-            _wire_logger("dreame_client", show_lib_debug)
-            _wire_logger("dreame_camera", show_lib_debug)
-            _wire_logger("dreame", show_lib_debug)
-
-            # python-miio: you can treat it the same way (or leave Indigo off always)
-            _wire_logger("miio", show_lib_debug)
-
-            # HTTP libs: file only, no Indigo spam
-            for http_name in ("urllib3", "requests"):
-                hl = logging.getLogger(http_name)
-                hl.setLevel(logging.WARNING)
-                hl.handlers[:] = []
-                hl.addHandler(self.plugin_file_handler)
-                hl.propagate = False
+            # All library logs will appear as DEBUG in Indigo (when showDebugInfo is True)
+            self._lib_indigo_handler = IndigoLogHandler(plugin_display_name, level=logging.DEBUG, force_debug=True)
+            self._lib_indigo_handler.setFormatter(_BARE_FMT)
+
+            self._wire_library_loggers(bool(self.pluginPrefs.get("showDebugInfo", False)))
 
             self.logger.debug("Attached dreame_client, dreame, miio, urllib3, requests loggers to handlers")
         except Exception as exc:
@@ -200,16 +660,52 @@ class Plugin(indigo.PluginBase):
             self.packages_installed = True
             self.logger.debug(f"Libaries Installed Updated:\n{installation_output}")
 
-        # Header
-        self.logger.info("")
-        self.logger.info("{0:=^100}".format("⚪️ Initializing Dreame Vacuum ⚪️"))
-        self.logger.info(f"{'Plugin name:':<24}{plugin_display_name}")
-        self.logger.info(f"{'Plugin version:':<24}{plugin_version}")
-        self.logger.info(f"{'Plugin ID:':<24}{plugin_id}")
-        self.logger.info(f"{'Indigo version:':<24}{indigo.server.version}")
-        self.logger.info(f"{'Platform:':<24}{platform.machine()}")
-        self.logger.info(f"{'Python:':<24}{sys.version.replace(os.linesep, ' ')}")
-        self.logger.info("{0:=^100}".format("🤖🤖🤖 End Initializing 🤖🤖🤖"))
+        # Header (one log record rather than one per line)
+        self.logger.info("\n".join((
+            "",
+            _BANNER_START,
+            f"{'Plugin name:':<24}{plugin_display_name}",
+            f"{'Plugin version:':<24}{plugin_version}",
+            f"{'Plugin ID:':<24}{plugin_id}",
+            f"{'Indigo version:':<24}{indigo.server.version}",
+            f"{'Platform:':<24}{platform.machine()}",
+            f"{'Python:':<24}{sys.version.replace(os.linesep, ' ')}",
+            _BANNER_END,
+        )))
+
+    def _apply_logger_level(self) -> None:
+        """
+        Set the plugin logger to the lowest of the Indigo/file handler levels and cache
+        whether DEBUG is on, so costly debug f-strings can be skipped when nobody wants them.
+        """
+        self.logger.setLevel(min(self.logLevel, self.fileloglevel))
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+    def _wire_library_loggers(self, show_lib_debug: bool) -> None:
+        """
+        Route the _LIBRARY_LOGGERS to the plugin file handler (via the log queue), and to Indigo when requested.
+        Handlers are added only if missing, so re-running this never duplicates records.
+        Logger levels follow the lowest level a handler will actually accept, so the libraries'
+        isEnabledFor(DEBUG) guards skip costly debug formatting when no handler wants it.
+        """
+        lib_handler = self._lib_indigo_handler
+        # Indigo-eligible: DEBUG when also shown in Indigo (that handler takes DEBUG), else the file level
+        eligible_level = logging.DEBUG if show_lib_debug else self.fileloglevel
+        for name, indigo_eligible in _LIBRARY_LOGGERS:
+            lg = logging.getLogger(name)
+            # Level and propagation first, so nothing emitted mid-wiring leaks to root or
+            # gets built below the level; the HTTP libs' WARNING level drops DEBUG/INFO in
+            # isEnabledFor(), before a record (or queue entry) is ever created
+            lg.propagate = False
+            lg.setLevel(eligible_level if indigo_eligible else max(logging.WARNING, self.fileloglevel))
+            if self._queue_handler not in lg.handlers:
+                lg.addHandler(self._queue_handler)
+            if indigo_eligible and show_lib_debug:
+                if lib_handler not in lg.handlers:
+                    lg.addHandler(lib_handler)
+            elif lib_handler in lg.handlers:
+                lg.removeHandler(lib_handler)
+        self._lib_wiring = (show_lib_debug, self.fileloglevel)
 
     ########################################
    # TESTING
@@ -220,17 +716,28 @@ class Plugin(indigo.PluginBase):
         dev: indigo.Device,
         message: str | None = None,
         auth_key: str | None = None,
+        account: str | None = None,
     ) -> None:
         """
-        Store cloud-login status and optional auth_key into device pluginProps.
+        Store cloud-login status and optional auth_key (with the _auth_account it belongs to) into device pluginProps.
         """
         try:
+            # Fresh copy: callers may hold a dev fetched before awaits/logins, whose props are out of date
+            dev = indigo.devices[dev.id]
             new_props = dev.pluginProps
-            if message is not None:
+            changed = False
+            if message is not None and new_props.get("dreameLoginInfo") != message:
                 new_props["dreameLoginInfo"] = message
-            if auth_key is not None:
+                changed = True
+            if auth_key is not None and (
+                new_props.get("authKey") != auth_key or new_props.get("authKeyAccount") != account
+            ):
                 new_props["authKey"] = auth_key
-            dev.replacePluginPropsOnServer(new_props)
+                new_props["authKeyAccount"] = account or ""
+                changed = True
+            # Server round-trip (and prefs write) only when something actually changed
+            if changed:
+                dev.replacePluginPropsOnServer(new_props)
         except Exception as exc:
             self.logger.debug(f"_update_dreame_login_info failed for '{dev.name}': {exc}")
 
@@ -251,18 +758,7 @@ class Plugin(indigo.PluginBase):
 
         This normalizes to a stripped string or ''.
         """
-        if raw is None:
-            return ""
-        # If it's a list-like, take first element
-        try:
-            if isinstance(raw, (list, tuple)) and raw:
-                raw = raw[0]
-        except Exception:
-            pass
-        try:
-            return str(raw).strip()
-        except Exception:
-            return ""
+        return _menu_value(raw)
 
     def dreame_loginAccount(self, values_dict, type_id, dev_id):
         """
@@ -308,8 +804,6 @@ class Plugin(indigo.PluginBase):
         )
 
         try:
-            from dreame.protocol import DreameVacuumProtocol
-
             proto = DreameVacuumProtocol(
                 username=username,
                 password=password,
@@ -336,7 +830,9 @@ class Plugin(indigo.PluginBase):
                 msg = "Cloud login OK."
                 if auth_key:
                     msg += " Auth key saved."
-                self._update_dreame_login_info(dev, msg, auth_key=auth_key)
+                self._update_dreame_login_info(
+                    dev, msg, auth_key=auth_key, account=_auth_account(username, country, account_type)
+                )
             else:
                 v_url = getattr(cloud, "verification_url", None)
                 if v_url:
@@ -399,14 +895,16 @@ class Plugin(indigo.PluginBase):
             self._update_dreame_login_info(dev, msg)
             return values_dict
 
-        # previously stored authKey (may be empty before first login)
-        stored_auth = (dev.pluginProps.get("authKey") or "").strip() or None
+        # previously stored authKey (may be empty before first login); only if it is this account's
+        props = dev.pluginProps
+        account = _auth_account(username, country, "mi")
+        stored_auth = (props.get("authKey") or "").strip() or None
+        if props.get("authKeyAccount") != account:
+            stored_auth = None
 
         self.logger.info(f"Submitting 2FA code for '{dev.name}'")
 
         try:
-            from dreame.protocol import DreameVacuumProtocol
-
             proto = DreameVacuumProtocol(
                 username=username,
                 password=password,
@@ -433,7 +931,7 @@ class Plugin(indigo.PluginBase):
             if ok and cloud.logged_in and not cloud.auth_failed:
                 new_key = getattr(cloud, "auth_key", None)
                 msg = "2FA verification successful. Auth key updated."
-                self._update_dreame_login_info(dev, msg, auth_key=new_key)
+                self._update_dreame_login_info(dev, msg, auth_key=new_key, account=account)
             else:
                 msg = "2FA verification failed. Check code and try again."
                 self._update_dreame_login_info(dev, msg)
@@ -486,6 +984,7 @@ class Plugin(indigo.PluginBase):
     ########################################
     def startup(self) -> None:
         self.logger.debug("startup called")
+        self._queue_listener.start()
 
         self._event_loop = asyncio.new_event_loop()
         self._async_thread = threading.Thread(target=self._run_async_thread, name="DreameAsync", daemon=True)
@@ -495,42 +994,87 @@ class Plugin(indigo.PluginBase):
     def shutdown(self) -> None:
         self.logger.debug("shutdown called")
         self.stopThread = True
+        if self._event_loop is not None and self._stop_event is not None and not self._event_loop.is_closed():
+            self._event_loop.call_soon_threadsafe(self._stop_event.set)
+        # Let _async_stop cancel polls and disconnect clients first: their log records and
+        # any cloud calls still in flight need the listener and executor alive until then
+        if self._async_thread is not None and self._async_thread is not threading.current_thread():
+            self._async_thread.join(timeout=10)
+        self._cloud_executor.shutdown(wait=False)
+        try:
+            # Flushes whatever the library loggers still have queued
+            self._queue_listener.stop()
+        except Exception:
+            pass
 
     def _run_async_thread(self) -> None:
         self.logger.debug("_run_async_thread starting")
         assert self._event_loop is not None
         asyncio.set_event_loop(self._event_loop)
+        self._stop_event = asyncio.Event()
 
         self._event_loop.create_task(self._async_start())
         self._event_loop.run_until_complete(self._async_stop())
 
         self._event_loop.close()
 
+    def _can_act(self, dev: indigo.Device) -> bool:
+        """
+        Common action guard: a Dreame vacuum device and the event loop is running.
+        """
+        return self._event_loop is not None and dev.deviceTypeId == VACUUM_TYPE_ID
+
+    def _submit(self, coro) -> None:
+        """
+        Schedule a coroutine on the plugin event loop from an Indigo thread (fire-and-forget).
+        Only one callable crosses threads (no concurrent.futures bridge as with
+        run_coroutine_threadsafe); the task is created on the loop and failures are logged there.
+        """
+        self._event_loop.call_soon_threadsafe(self._spawn, coro)
+
+    def _spawn(self, coro) -> None:
+        # Runs on the event loop thread
+        task = self._event_loop.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        task.add_done_callback(self._log_future_exception)
+
+    def _submit_action(self, dev: indigo.Device, what: str, coro_fn, *args) -> None:
+        """
+        Shared body of the simple Indigo action callbacks: guard, log the request,
+        then schedule coro_fn(dev, *args) (the coroutine is only created if it will run).
+        """
+        if not self._can_act(dev):
+            return
+        self.logger.info(f"{what} requested for '{dev.name}'")
+        self._submit(coro_fn(dev, *args))
+
+    def _log_future_exception(self, fut: asyncio.Future) -> None:
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        if exc is not None:
+            self.logger.error(f"Background task failed: {exc}", exc_info=exc)
+
     async def _async_start(self) -> None:
         self.logger.debug("_async_start")
         self.logger.debug("Starting event loop and setting up any connections")
         # nothing global yet
 
     async def _async_stop(self) -> None:
-        while True:
-            await asyncio.sleep(5.0)
-            if self.stopThread:
-                # Disconnect all clients & cancel polls
-                for dev_id, t in list(self._poll_tasks.items()):
-                    if t and not t.done():
-                        t.cancel()
-                for dev_id, t in list(self._map_tasks.items()):
-                    if t and not t.done():
-                        t.cancel()
-                for dev_id, client in list(self._clients.items()):
-                    try:
-                        await client.disconnect()
-                    except Exception:
-                        pass
-                self._poll_tasks.clear()
-                self._map_tasks.clear()
-                self._clients.clear()
-                break
+        # Sleeps until shutdown() sets the event (stopThread covers a shutdown that raced startup)
+        if not self.stopThread:
+            await self._stop_event.wait()
+
+        # Cancel polls (and let them unwind) before disconnecting the clients they use
+        cancels = [t for t in self._poll_tasks.values() if t and not t.done()]
+        for t in cancels:
+            t.cancel()
+        await asyncio.gather(*cancels, return_exceptions=True)
+        # Disconnect concurrently: shutdown takes the slowest device, not the sum of all
+        await asyncio.gather(*(client.disconnect() for client in list(self._clients.values())), return_exceptions=True)
+        self._poll_tasks.clear()
+        self._clients.clear()
 
     ########################################
     # Plugin config
@@ -547,8 +1091,16 @@ class Plugin(indigo.PluginBase):
             self.pluginPrefs["showDebugInfo"] = bool(values_dict.get("showDebugInfo", False))
             self.pluginPrefs["showDebugLevel"] = int(values_dict.get("showDebugLevel", logging.INFO))
             self.pluginPrefs["showDebugFileLevel"] = int(values_dict.get("showDebugFileLevel", logging.DEBUG))
+            try:
+                self.status_cache_seconds = max(0.0, float(values_dict.get("statusCacheSeconds", 3) or 0))
+            except Exception:
+                self.status_cache_seconds = 3.0
+            self.pluginPrefs["statusCacheSeconds"] = str(self.status_cache_seconds)
             indigo.server.savePluginPrefs()
 
+            for client in list(self._clients.values()):
+                client.set_status_ttl(self.status_cache_seconds)
+
             self.logLevel = int(values_dict.get("showDebugLevel", logging.INFO))
             self.fileloglevel = int(values_dict.get("showDebugFileLevel", logging.DEBUG))
             show_lib_debug = bool(values_dict.get("showDebugInfo", False))
@@ -558,36 +1110,14 @@ class Plugin(indigo.PluginBase):
                 self.indigo_log_handler.setLevel(self.logLevel)
             if hasattr(self, "plugin_file_handler") and self.plugin_file_handler:
                 self.plugin_file_handler.setLevel(self.fileloglevel)
+            self._apply_logger_level()
 
-            # Rewire library loggers according to updated showDebugInfo
-            try:
-                lib_indigo_handler = None
-                if show_lib_debug:
-                    lib_indigo_handler = IndigoLogHandler(self.pluginDisplayName, level=logging.DEBUG, force_debug=True)
-                    lib_indigo_handler.setFormatter(logging.Formatter("%(message)s"))
-
-                def _rewire(name: str, to_indigo: bool):
-                    lg = logging.getLogger(name)
-                    lg.setLevel(logging.DEBUG)
-                    lg.handlers[:] = []
-                    lg.addHandler(self.plugin_file_handler)
-                    if to_indigo and lib_indigo_handler:
-                        lg.addHandler(lib_indigo_handler)
-                    lg.propagate = False
-
-                _rewire("dreame_client", show_lib_debug)
-                _rewire("dreame_camera", show_lib_debug)
-                _rewire("dreame", show_lib_debug)
-                _rewire("miio", show_lib_debug)
-
-                for http_name in ("urllib3", "requests"):
-                    hl = logging.getLogger(http_name)
-                    hl.setLevel(logging.WARNING)
-                    hl.handlers[:] = []
-                    hl.addHandler(self.plugin_file_handler)
-                    hl.propagate = False
-            except Exception as exc:
-                self.logger.debug(f"Rewiring library loggers failed: {exc}")
+            # Rewire library loggers (same cached handler) only if showDebugInfo or the file level changed
+            if (show_lib_debug, self.fileloglevel) != self._lib_wiring:
+                try:
+                    self._wire_library_loggers(show_lib_debug)
+                except Exception as exc:
+                    self.logger.debug(f"Rewiring library loggers failed: {exc}")
 
             self.logger.debug(f"logLevel = {self.logLevel}")
             self.logger.debug("User prefs saved.")
@@ -606,26 +1136,16 @@ class Plugin(indigo.PluginBase):
     # Device config
     ########################################
     def validateDeviceConfigUi(self, values_dict: indigo.Dict, type_id: str, dev_id: int):
-        errors = {}
         login_mode = (values_dict.get("loginMode") or "cloud").strip().lower()
+        required = _REQUIRED_CLOUD_FIELDS if login_mode == "cloud" else _REQUIRED_LOCAL_FIELDS
 
-        if login_mode == "cloud":
-            username = (values_dict.get("username") or "").strip()
-            password = (values_dict.get("password") or "").strip()
-            if not username:
-                errors["username"] = "Username / email is required for cloud mode."
-            if not password:
-                errors["password"] = "Password is required for cloud mode."
-            country = (values_dict.get("country") or "").strip()
-            if not country:
-                errors["country"] = "Country code is required for cloud mode."
-        else:
-            host = (values_dict.get("host") or "").strip()
-            token = (values_dict.get("token") or "").strip()
-            if not host:
-                errors["host"] = "Local IP/host is required for local mode."
-            if not token:
-                errors["token"] = "Local device token is required for local mode."
+        # errors is only allocated when a field is actually missing (the usual save passes)
+        errors = None
+        for key, message in required:
+            if not (values_dict.get(key) or "").strip():
+                if errors is None:
+                    errors = {}
+                errors[key] = message
 
         if errors:
             return (False, errors, values_dict)
@@ -636,119 +1156,77 @@ class Plugin(indigo.PluginBase):
     ########################################
     # Device lifecycle
     ########################################
+    def didDeviceCommPropertyChange(self, orig_dev: indigo.Device, new_dev: indigo.Device) -> bool:
+        """
+        Restart comm only for real config changes, not for a refreshed cloud session (authKey).
+        """
+        orig_props = orig_dev.pluginProps
+        new_props = new_dev.pluginProps
+        keys = (set(orig_props.keys()) | set(new_props.keys())) - _SESSION_PROPS
+        return any(orig_props.get(k) != new_props.get(k) for k in keys)
+
     def deviceStartComm(self, dev: indigo.Device) -> None:
-        if dev.deviceTypeId != "dreame_vacuum":
+        if dev.deviceTypeId != VACUUM_TYPE_ID:
             return
 
         self.logger.info(f"Starting Dreame vacuum '{dev.name}'")
         dev.stateListOrDisplayStateIdChanged()
 
-        # Reflect mapping_updates_enabled state from config (optional)
-        try:
-            ena = bool(dev.pluginProps.get("enableMappingUpdates", False))
-            dev.updateStateOnServer("mapping_updates_enabled", ena)
-        except Exception:
-            pass
+        device = dev
+        if not hasattr(dev, "onState"):  ## if custom
+            self.logger.debug("onState Not in Props converting device..")
+            converted = indigo.device.changeDeviceTypeId(dev, dev.deviceTypeId)
+            converted.replaceOnServer()
+            device = indigo.devices[dev.id]
 
-        # Initialise extended states to something sane
+        # Relay-style props: only written when one differs (normally just the first start)
+        props = device.pluginProps
+        if any(props.get(key) != value for key, value in _RELAY_PROPS):
+            for key, value in _RELAY_PROPS:
+                props[key] = value
+            device.replacePluginPropsOnServer(props)
+
+        # Initialise extended states to something sane (incl. mapping_updates_enabled from
+        # config and the relay state) in one server round-trip, after the props are final
         try:
-            kv = [
-                # Core summary
-                {"key": "status", "value": "Initializing"},
-                {"key": "battery", "value": 0},
-                {"key": "fan_speed", "value": ""},
-                {"key": "area_cleaned_m2", "value": 0.0},
-                {"key": "duration_min", "value": 0},
-                {"key": "shortcuts", "value": ""},
-                {"key": "charging", "value": False},
-                {"key": "error_text", "value": ""},
-                {"key": "last_update", "value": ""},
-
-                # Extended robot / dock / task states
-                {"key": "robot_state", "value": "Unknown"},
-                {"key": "robot_state_detail", "value": "Initializing"},
-                {"key": "station_state", "value": ""},
-                {"key": "task_status", "value": ""},
-                {"key": "cleaning_mode", "value": ""},
-
-                # Cleaning parameters
-                {"key": "water_volume", "value": 0},
-                {"key": "mop_wetness_level", "value": 0},
-                {"key": "cleaning_progress", "value": 0},
-
-                # Base / self-wash / drying
-                {"key": "self_wash_base_status", "value": ""},
-                {"key": "drying_progress", "value": 0},
-                {"key": "auto_empty_status", "value": ""},
-                {"key": "station_drainage_status", "value": ""},
-
-                # Combined / water temp
-                {"key": "combined_status", "value": "Initializing"},
-                {"key": "water_temperature", "value": ""},
-
-                # Consumables / health
-                {"key": "main_brush_left", "value": 0},
-                {"key": "side_brush_left", "value": 0},
-                {"key": "filter_left", "value": 0},
-                {"key": "dirty_water_tank_left", "value": 0},
-                {"key": "scale_inhibitor_left", "value": 0},
-
-                # AI / mapping capability summary
-                {"key": "ai_obstacle_detection", "value": False},
-                {"key": "ai_pet_detection", "value": False},
-
-                # Map / room metadata
-                {"key": "map_list", "value": ""},
-                {"key": "current_map_id", "value": 0},
-                {"key": "multi_floor_map", "value": False},
-                {"key": "mapping_updates_enabled", "value": bool(dev.pluginProps.get("enableMappingUpdates", False))},
-                {"key": "selected_map", "value": ""},
-                {"key": "room_list", "value": ""},
-                {"key": "current_room", "value": ""},
-                {"key": "current_segment_id", "value": 0},
-                {"key": "cleaning_sequence", "value": ""},
-
-                # Raw vacuum_state
-                {"key": "vacuum_state", "value": ""},
-            ]
-            dev.updateStatesOnServer(kv)
+            enable_mapping = bool(props.get("enableMappingUpdates", False))
+            kv = list(_INITIAL_KV)
+            kv[_MAPPING_STATE_INDEX] = {"key": "mapping_updates_enabled", "value": enable_mapping}
+            device.updateStatesOnServer(kv)
         except Exception:
             pass
 
-        if hasattr(dev, 'onState') == False:  ## if custom
-            self.logger.debug("onState Not in Props converting device..")
-            device = indigo.device.changeDeviceTypeId(dev, dev.deviceTypeId)
-            device.replaceOnServer()
-
-        device = indigo.devices[dev.id]
-        props = device.pluginProps
-        props["SupportsSensorValue"] = True
-        props["SupportsOnState"] = True
-        props["AllowSensorValueChange"] = False
-        props["AllowOnStateChange"] = True
-        props["SupportsStatusRequest"] = False
-        device.replacePluginPropsOnServer(props)
-        device.updateStateOnServer(key="onOffState", value=False)
+        # Fresh baseline: the first poll pushes every state
+        self._last_states.pop(dev.id, None)
 
         if self._event_loop:
-            asyncio.run_coroutine_threadsafe(self._async_device_connect(dev), self._event_loop)
+            self._submit(self._async_device_connect(dev))
 
 
     def deviceStopComm(self, dev: indigo.Device) -> None:
-        if dev.deviceTypeId != "dreame_vacuum":
+        if dev.deviceTypeId != VACUUM_TYPE_ID:
             return
 
         self.logger.info(f"Stopping Dreame vacuum '{dev.name}'")
         client = self._clients.pop(dev.id, None)
         task = self._poll_tasks.pop(dev.id, None)
-        map_task = self._map_tasks.pop(dev.id, None)
-
-        if task and self._event_loop:
+        self._poll_wake.pop(dev.id, None)
+        self._camera_helpers.pop((dev.id, False), None)
+        self._camera_helpers.pop((dev.id, True), None)
+        self._combined_status.pop(dev.id, None)
+        self._last_states.pop(dev.id, None)
+
+        # Task.cancel() isn't thread-safe: cancel and disconnect on the loop, in one hop
+        if self._event_loop and (task or client):
+            self._submit(self._async_device_stop(task, client))
+
+    async def _async_device_stop(self, task: asyncio.Task | None, client: AsyncDreameClient | None) -> None:
+        # Let the poll unwind before disconnecting the client it uses
+        if task is not None:
             task.cancel()
-        if map_task and self._event_loop:
-            map_task.cancel()
-        if client and self._event_loop:
-            asyncio.run_coroutine_threadsafe(client.disconnect(), self._event_loop)
+            await asyncio.gather(task, return_exceptions=True)
+        if client:
+            await client.disconnect()
 
     ########################################
     # Actions (relay semantics)
@@ -759,7 +1237,7 @@ class Plugin(indigo.PluginBase):
         """
         Action: start a Dreame shortcut (favourite) by id selected from menu.
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
+        if not self._can_act(dev):
             return
         self.logger.debug(f"start_shortcut: props={plugin_action.props}")
 
@@ -772,10 +1250,7 @@ class Plugin(indigo.PluginBase):
 
         # Keep as string; dreame lib is fine with string IDs
         self.logger.info(f"Start Shortcut: id={sid_raw!r} requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(
-            self._async_start_shortcut(dev, sid_raw),
-            self._event_loop,
-        )
+        self._submit(self._async_start_shortcut(dev, sid_raw))
 
     async def _async_start_shortcut(self, dev: indigo.Device, shortcut_id: str):
         client = self._clients.get(dev.id)
@@ -784,15 +1259,13 @@ class Plugin(indigo.PluginBase):
             self._update_status(dev, "Not connected")
             return
 
-        # Dreame/Mova shortcuts are numeric ids; pass int when possible
-        try:
-            sid = int(shortcut_id)
-        except Exception:
-            sid = shortcut_id  # fall back to raw string
+        # Dreame/Mova shortcuts are numeric ids; pass int when possible (cached per id string)
+        sid = _shortcut_id(shortcut_id)
 
-        self.logger.debug(
-            f"_async_start_shortcut: calling client.start_shortcut({sid!r}) for '{dev.name}'"
-        )
+        if self._debug_enabled:
+            self.logger.debug(
+                f"_async_start_shortcut: calling client.start_shortcut({sid!r}) for '{dev.name}'"
+            )
 
         try:
             await client.start_shortcut(sid)
@@ -807,64 +1280,37 @@ class Plugin(indigo.PluginBase):
         """
         Action: start washing (self-wash base).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Start washing requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(
-            self._async_call_client_wash_action(dev, "start_washing"),
-            self._event_loop,
-        )
+        self._submit_action(dev, "Start washing", self._async_call_client_wash_action, "start_washing")
 
     def pause_washing(self, plugin_action, dev):
         """
         Action: pause washing (self-wash base).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Pause washing requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(
-            self._async_call_client_wash_action(dev, "pause_washing"),
-            self._event_loop,
-        )
+        self._submit_action(dev, "Pause washing", self._async_call_client_wash_action, "pause_washing")
 
     def start_drying(self, plugin_action, dev):
         """
         Action: start drying (self-wash base).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Start drying requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(
-            self._async_call_client_wash_action(dev, "start_drying"),
-            self._event_loop,
-        )
+        self._submit_action(dev, "Start drying", self._async_call_client_wash_action, "start_drying")
 
     def stop_drying(self, plugin_action, dev):
         """
         Action: stop drying (self-wash base).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Stop drying requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(
-            self._async_call_client_wash_action(dev, "stop_drying"),
-            self._event_loop,
-        )
+        self._submit_action(dev, "Stop drying", self._async_call_client_wash_action, "stop_drying")
 
     def start_draining(self, plugin_action, dev):
         """
         Action: start draining (self-wash base).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
+        if not self._can_act(dev):
             return
         clean_tank = bool(plugin_action.props.get("cleanWaterTank"))
         self.logger.info(
             f"Start draining requested for '{dev.name}' (clean_water_tank={clean_tank})"
         )
-        asyncio.run_coroutine_threadsafe(
-            self._async_call_client_wash_action(dev, "start_draining", clean_tank),
-            self._event_loop,
-        )
+        self._submit(self._async_call_client_wash_action(dev, "start_draining", clean_tank))
 
     async def _async_call_client_wash_action(self, dev: indigo.Device, method: str, *args):
         """
@@ -875,7 +1321,11 @@ class Plugin(indigo.PluginBase):
             self._update_status(dev, "Not connected")
             return
         fn = getattr(client, method, None)
-        if not fn or not asyncio.iscoroutinefunction(fn):
+        key = (type(client), method)
+        is_coro = _COROFN_CACHE.get(key)
+        if is_coro is None:
+            is_coro = _COROFN_CACHE[key] = bool(fn) and asyncio.iscoroutinefunction(fn)
+        if not is_coro:
             self.logger.error(f"_async_call_client_wash_action: client has no async method {method}")
             return
         try:
@@ -891,19 +1341,13 @@ class Plugin(indigo.PluginBase):
         """
         Action: start/resume cleaning (HA async_start equivalent).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Start cleaning requested (action) for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_start_clean(dev), self._event_loop)
+        self._submit_action(dev, "Start cleaning (action)", self._async_start_clean)
 
     def start_pause(self, plugin_action, dev):
         """
         Action: start or pause cleaning (HA async_start_pause equivalent).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Start/Pause requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_start_pause(dev), self._event_loop)
+        self._submit_action(dev, "Start/Pause", self._async_start_pause)
 
     async def _async_start_pause(self, dev: indigo.Device):
         client = self._clients.get(dev.id)
@@ -921,10 +1365,7 @@ class Plugin(indigo.PluginBase):
         """
         Action: stop cleaning (HA async_stop equivalent).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Stop cleaning requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_stop_clean(dev), self._event_loop)
+        self._submit_action(dev, "Stop cleaning", self._async_stop_clean)
 
     async def _async_stop_clean(self, dev: indigo.Device):
         client = self._clients.get(dev.id)
@@ -941,10 +1382,7 @@ class Plugin(indigo.PluginBase):
         """
         Action: pause cleaning (HA async_pause equivalent).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Pause cleaning requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_pause_clean(dev), self._event_loop)
+        self._submit_action(dev, "Pause cleaning", self._async_pause_clean)
 
     async def _async_pause_clean(self, dev: indigo.Device):
         client = self._clients.get(dev.id)
@@ -962,17 +1400,14 @@ class Plugin(indigo.PluginBase):
         Action: return to base (HA async_return_to_base).
         Wrapper just to avoid clashing with _async_return_to_dock.
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Return to base requested (action) for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_return_to_dock(dev), self._event_loop)
+        self._submit_action(dev, "Return to base (action)", self._async_return_to_dock)
 
     def custom_clean_room(self, plugin_action, dev):
         """
         Action: custom clean a single room (segment) with specific suction/water/repeats/mode.
         Uses menu-driven values that broadly match the Dreame library expectations.
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
+        if not self._can_act(dev):
             return
 
         # Room menu returns segment id as value string
@@ -1015,7 +1450,7 @@ class Plugin(indigo.PluginBase):
             f"mode={cleaning_mode!r}, wetness={wetness_level!r})"
         )
 
-        asyncio.run_coroutine_threadsafe(
+        self._submit(
             self._async_custom_clean_room(
                 dev,
                 segment_id=segment_id,
@@ -1025,7 +1460,6 @@ class Plugin(indigo.PluginBase):
                 cleaning_mode=cleaning_mode,
                 wetness_level=wetness_level,
             ),
-            self._event_loop,
         )
 
     async def _async_custom_clean_room(
@@ -1076,95 +1510,64 @@ class Plugin(indigo.PluginBase):
 
 
     def actionControlDevice(self, action, dev):
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
+        if not self._can_act(dev):
             return
 
-        # Read relay mapping from device props (menus can be list-like)
+        device_action = action.deviceAction
+        # Relay mapping comes from device props (menus can be list-like); only read what's needed
         props = dev.pluginProps
-        relay_on_action = self._get_menu_value(props.get("relayOnAction")) or "start_clean"
-        relay_off_action = self._get_menu_value(props.get("relayOffAction")) or "dock"
-        relay_on_shortcut = self._get_menu_value(props.get("relayOnShortcut"))
-        relay_off_shortcut = self._get_menu_value(props.get("relayOffShortcut"))
 
-        if action.deviceAction == indigo.kDeviceAction.TurnOn:
+        if device_action == indigo.kDeviceAction.TurnOn:
             # ON: either start cleaning or run shortcut
-            if relay_on_action == "shortcut" and relay_on_shortcut:
+            relay_on_action = _menu_value(props.get("relayOnAction")) or "start_clean"
+            relay_on_shortcut = (
+                _menu_value(props.get("relayOnShortcut")) if relay_on_action == "shortcut" else None
+            )
+            if relay_on_shortcut:
                 self.logger.info(
                     f"Relay ON → start shortcut {relay_on_shortcut!r} for '{dev.name}'"
                 )
-                asyncio.run_coroutine_threadsafe(
-                    self._async_start_shortcut(dev, relay_on_shortcut),
-                    self._event_loop,
-                )
+                self._submit(self._async_start_shortcut(dev, relay_on_shortcut))
             else:
                 self.logger.info(f"Relay ON → start cleaning for '{dev.name}'")
-                asyncio.run_coroutine_threadsafe(
-                    self._async_start_clean(dev),
-                    self._event_loop,
-                )
+                self._submit(self._async_start_clean(dev))
 
-        elif action.deviceAction == indigo.kDeviceAction.TurnOff:
+        elif device_action == indigo.kDeviceAction.TurnOff:
             # OFF: dock, pause, stop, or shortcut
-            if relay_off_action == "pause":
-                self.logger.info(f"Relay OFF → pause cleaning for '{dev.name}'")
-                asyncio.run_coroutine_threadsafe(
-                    self._async_pause_clean(dev),
-                    self._event_loop,
-                )
-            elif relay_off_action == "stop":
-                self.logger.info(f"Relay OFF → stop cleaning for '{dev.name}'")
-                asyncio.run_coroutine_threadsafe(
-                    self._async_stop_clean(dev),
-                    self._event_loop,
-                )
-            elif relay_off_action == "shortcut" and relay_off_shortcut:
-                self.logger.info(
-                    f"Relay OFF → start shortcut {relay_off_shortcut!r} for '{dev.name}'"
-                )
-                asyncio.run_coroutine_threadsafe(
-                    self._async_start_shortcut(dev, relay_off_shortcut),
-                    self._event_loop,
-                )
-            else:
-                # Default: return to dock
-                self.logger.info(f"Relay OFF → return to dock for '{dev.name}'")
-                asyncio.run_coroutine_threadsafe(
-                    self._async_return_to_dock(dev),
-                    self._event_loop,
-                )
+            relay_off_action = _menu_value(props.get("relayOffAction")) or "dock"
+            if relay_off_action == "shortcut":
+                relay_off_shortcut = _menu_value(props.get("relayOffShortcut"))
+                if relay_off_shortcut:
+                    self.logger.info(
+                        f"Relay OFF → start shortcut {relay_off_shortcut!r} for '{dev.name}'"
+                    )
+                    self._submit(self._async_start_shortcut(dev, relay_off_shortcut))
+                    return
+            # Default (unknown / shortcut without id): return to dock
+            text, coro_fn = self._relay_off_dispatch.get(relay_off_action) or self._relay_off_dispatch["dock"]
+            self.logger.info(f"Relay OFF → {text} for '{dev.name}'")
+            self._submit(coro_fn(dev))
 
-        elif action.deviceAction == indigo.kDeviceAction.Toggle:
+        elif device_action == indigo.kDeviceAction.Toggle:
             # Keep simple toggle heuristic based on status text
             status = (dev.states.get("status") or "").lower()
-            if any(x in status for x in ("clean", "zone", "segment")):
+            if _toggle_active(status) is not None:
                 self.logger.info(f"Toggling OFF (dock) '{dev.name}'")
-                asyncio.run_coroutine_threadsafe(
-                    self._async_return_to_dock(dev),
-                    self._event_loop,
-                )
+                self._submit(self._async_return_to_dock(dev))
             else:
                 self.logger.info(f"Toggling ON (clean) '{dev.name}'")
-                asyncio.run_coroutine_threadsafe(
-                    self._async_start_clean(dev),
-                    self._event_loop,
-                )
+                self._submit(self._async_start_clean(dev))
 
     # Actions.xml
     ########################################
     # Actions.xml
     ########################################
     def locate_vacuum(self, plugin_action, dev):
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Locate vacuum requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_locate(dev), self._event_loop)
+        self._submit_action(dev, "Locate vacuum", self._async_locate)
 
     def set_fan_speed(self, plugin_action, dev):
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
         speed = plugin_action.props.get("speed", "")
-        self.logger.info(f"Set fan speed '{speed}' requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_set_fan_speed(dev, speed), self._event_loop)
+        self._submit_action(dev, f"Set fan speed '{speed}'", self._async_set_fan_speed, speed)
 
     # Add this new Indigo Action callback to Plugin class, alongside locate_vacuum / set_fan_speed
 
@@ -1172,19 +1575,13 @@ class Plugin(indigo.PluginBase):
         """
         Action: save current floor map snapshot as PNG into ~/Pictures.
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"Map snapshot requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_save_map_snapshot(dev, wifi=False), self._event_loop)
+        self._submit_action(dev, "Map snapshot", self._async_save_map_snapshot)
 
     def save_wifi_map_snapshot(self, plugin_action, dev):
         """
         Action: save current WiFi coverage map snapshot as PNG into ~/Pictures (if available).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
-            return
-        self.logger.info(f"WiFi map snapshot requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(self._async_save_wifi_map_snapshot(dev), self._event_loop)
+        self._submit_action(dev, "WiFi map snapshot", self._async_save_wifi_map_snapshot)
     ########################################
     # Async methods
     ########################################
@@ -1195,36 +1592,21 @@ class Plugin(indigo.PluginBase):
                 return
 
             props = dev.pluginProps
-            username = (props.get("username") or "").strip() or None
-            password = (props.get("password") or "").strip() or None
-            country = (props.get("country") or "").strip().lower() or "eu"
-            login_mode = (props.get("loginMode") or "cloud").strip().lower()
+            username = _prop_str(props, "username")
+            password = _prop_str(props, "password")
+            country = (_prop_str(props, "country") or "eu").lower()
+            login_mode = (_prop_str(props, "loginMode") or "cloud").lower()
             raw_account_type = props.get("accountType")
-            dreame_device_id = (props.get("dreame_device_id") or "").strip() or None
-
-            # Normalize Indigo menu value to a lower-case string:
-            # - menu can be a list like ['mova'] or just 'mova'
-            def _normalize_account_type(raw):
-                if raw is None:
-                    return "dreame"
-                try:
-                    if isinstance(raw, (list, tuple)) and raw:
-                        raw = raw[0]
-                except Exception:
-                    pass
-                try:
-                    at = str(raw).strip().lower()
-                    return at or "dreame"
-                except Exception:
-                    return "dreame"
+            dreame_device_id = _prop_str(props, "dreame_device_id")
 
             account_type_raw_str = _normalize_account_type(raw_account_type)
 
-            self.logger.debug(
-                f"_async_device_connect: dev='{dev.name}', loginMode={login_mode!r}, "
-                f"username_set={bool(username)}, country={country!r}, dreame_device_id={dreame_device_id!r}, "
-                f"raw_account_type={raw_account_type!r} -> account_type_raw_str={account_type_raw_str!r}"
-            )
+            if self._debug_enabled:
+                self.logger.debug(
+                    f"_async_device_connect: dev='{dev.name}', loginMode={login_mode!r}, "
+                    f"username_set={bool(username)}, country={country!r}, dreame_device_id={dreame_device_id!r}, "
+                    f"raw_account_type={raw_account_type!r} -> account_type_raw_str={account_type_raw_str!r}"
+                )
 
             host_for_client = None
             token_for_client = None
@@ -1254,26 +1636,28 @@ class Plugin(indigo.PluginBase):
                 device_id_for_client = cloud_info["device_id"]
                 auth_key_for_client = cloud_info["auth_key"]
 
-                self.logger.debug(
-                    f"Cloud login/discovery OK for '{dev.name}': host={host_for_client!r}, "
-                    f"token_len={len(token_for_client) if token_for_client else 0}, "
-                    f"mac={mac_for_client!r}, did={device_id_for_client!r}, "
-                    f"account_type={account_type_norm!r}, auth_key_present={bool(auth_key_for_client)}"
-                )
+                if self._debug_enabled:
+                    self.logger.debug(
+                        f"Cloud login/discovery OK for '{dev.name}': host={host_for_client!r}, "
+                        f"token_len={len(token_for_client) if token_for_client else 0}, "
+                        f"mac={mac_for_client!r}, did={device_id_for_client!r}, "
+                        f"account_type={account_type_norm!r}, auth_key_present={bool(auth_key_for_client)}"
+                    )
 
                 final_account_type = account_type_norm
 
             # ====== LOCAL MODE (manual IP + token, no cloud) ======
             else:
-                host_for_client = (props.get("host") or "").strip() or None
-                token_for_client = (props.get("token") or "").strip() or None
+                host_for_client = _prop_str(props, "host")
+                token_for_client = _prop_str(props, "token")
                 prefer_cloud = False
                 final_account_type = "local"
 
-                self.logger.debug(
-                    f"Local mode for '{dev.name}': host={host_for_client!r}, "
-                    f"token_len={len(token_for_client) if token_for_client else 0}"
-                )
+                if self._debug_enabled:
+                    self.logger.debug(
+                        f"Local mode for '{dev.name}': host={host_for_client!r}, "
+                        f"token_len={len(token_for_client) if token_for_client else 0}"
+                    )
 
                 if not host_for_client or not token_for_client:
                     self._update_status(dev, "Local mode requires host and token")
@@ -1293,35 +1677,28 @@ class Plugin(indigo.PluginBase):
                 device_id=device_id_for_client,
                 auth_key=auth_key_for_client,
                 account_type=final_account_type,
+                status_ttl=self.status_cache_seconds,
             )
 
             self._clients[dev.id] = client
             await client.connect()
             self._update_status(dev, "Connected")
 
-            await self._async_refresh_state(dev, client)
+            # First refresh inline (a failure here fails the connect), then hand it to the poll loop
+            status = await self._async_refresh_state(dev, client)
 
-            if dev.id in self._poll_tasks and not self._poll_tasks[dev.id].done():
-                self._poll_tasks[dev.id].cancel()
-            self._poll_tasks[dev.id] = asyncio.create_task(self._poll_loop(dev, client))
-
-            # Start map poll loop (only after client exists)
-            if dev.id in self._map_tasks and not self._map_tasks[dev.id].done():
-                self._map_tasks[dev.id].cancel()
-            self._map_tasks[dev.id] = asyncio.create_task(self._map_poll_loop(dev))
+            self._start_device_task(self._poll_tasks, dev.id, "poll", self._poll_loop(dev, client, status))
 
         except DeviceException as de:
-            import traceback as _tb
             self.logger.error(
                 f"Dreame DeviceException while connecting '{dev.name}': {de}\n"
-                f"Traceback:\n{_tb.format_exc()}"
+                f"Traceback:\n{traceback.format_exc()}"
             )
             self._update_status(dev, f"Dreame error: {de}")
         except Exception as exc:
-            import traceback as _tb
             self.logger.error(
                 f"Failed to connect Dreame for '{dev.name}': {exc}\n"
-                f"Traceback:\n{_tb.format_exc()}"
+                f"Traceback:\n{traceback.format_exc()}"
             )
             self._update_status(dev, f"Error: {exc}")
 
@@ -1333,17 +1710,6 @@ class Plugin(indigo.PluginBase):
 
         It looks for string attributes whose names suggest an image/icon.
         """
-        import os
-        import base64
-        import zlib
-
-        try:
-            # In this repo, resources are in dreame/resources.py
-            import dreame.resources as dreame_resources
-        except Exception as exc:
-            self.logger.error(f"export_map_resources: could not import dreame.resources: {exc}")
-            return
-
         # Choose a target directory under Indigo's Pictures folder
         pics_dir = os.path.expanduser("~/Pictures")
         # e.g. "/Library/Application Support/Perceptive Automation/Indigo 2025.1"
@@ -1354,68 +1720,37 @@ class Plugin(indigo.PluginBase):
             self.logger.error(f"export_map_resources: could not create export dir '{export_dir}': {exc}")
             return
 
-        count = 0
-        skipped = 0
-
-        for name in dir(dreame_resources):
-            if not name.isupper():
-                continue
-            # Only consider likely image/icon constants
-            if not any(k in name for k in ("IMAGE", "ICON", "MAP_FONT", "DEFAULT_MAP")):
-                continue
+        names = _resource_names()
 
-            value = getattr(dreame_resources, name, None)
-            if not isinstance(value, str):
-                skipped += 1
-                continue
-
-            # Determine extension: font vs PNG
-            if name.startswith("MAP_FONT"):
-                ext = ".ttf"
-            else:
-                ext = ".png"
-
-            # Some assets may be raw PNG base64, some may be gzipped+base64
-            data = None
-            b = None
-            try:
-                b = base64.b64decode(value, validate=False)
-            except Exception:
-                # Not base64, skip
-                skipped += 1
-                continue
-
-            # Try raw first
-            try:
-                if ext == ".png":
-                    # crude PNG header check
-                    if b.startswith(b"\x89PNG\r\n\x1a\n"):
-                        data = b
-                    else:
-                        # maybe gzip-wrapped png
-                        data = zlib.decompress(b, zlib.MAX_WBITS | 32)
-                else:
-                    # font or other
-                    data = zlib.decompress(b, zlib.MAX_WBITS | 32)
-            except Exception:
-                # if decompression fails, just use raw
-                if ext == ".png":
-                    data = b
-                else:
-                    skipped += 1
-                    continue
+        def _export(name: str) -> bool:
+            decoded = _decoded_resource(name)
+            if decoded is None:
+                return False
+            payload, ext, compressed = decoded
 
             # Write file
             safe_name = name.lower().replace("map_", "").replace("__", "_")
             filename = f"{safe_name}{ext}"
             out_path = os.path.join(export_dir, filename)
             try:
-                with open(out_path, "wb") as f:
-                    f.write(data)
-                count += 1
+                try:
+                    _write_resource(out_path, payload, compressed)
+                except zlib.error:
+                    # if decompression fails, just use raw (PNG only)
+                    if ext != ".png":
+                        os.remove(out_path)
+                        return False
+                    _write_resource(out_path, payload, False)
+                return True
             except Exception as exc:
                 self.logger.error(f"export_map_resources: failed to write {out_path}: {exc}")
-                skipped += 1
+                return False
+
+        # Resources are independent, and zlib inflate and file writes release the GIL
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            results = list(pool.map(_export, names))
+        count = sum(results)
+        skipped = len(results) - count
 
         self.logger.info(
             f"export_map_resources: wrote {count} files to '{export_dir}' (skipped {skipped} entries)."
@@ -1430,137 +1765,160 @@ class Plugin(indigo.PluginBase):
         """
         await self._async_save_map_snapshot(dev, wifi=False)
 
-    async def _map_poll_loop(self, dev: indigo.Device):
-        """
-        Periodically request map data while the vacuum is actively cleaning
-        and device config 'enableMappingUpdates' is True.
-        """
-        dev_id = dev.id
-        self.logger.debug(f"Map poll loop starting for '{dev.name}'")
-
-        while not self.stopThread and dev.id in self._clients:
-            try:
-                # Refresh dev reference (it may be reloaded)
-                dev = indigo.devices.get(dev_id)
-                if not dev or not dev.enabled or dev.deviceTypeId != "dreame_vacuum":
-                    break
-
-                # Check config flag
-                enable = bool(dev.pluginProps.get("enableMappingUpdates", False))
-                try:
-                    dev.updateStateOnServer("mapping_updates_enabled", enable)
-                except Exception:
-                    pass
-
-                if enable:
-                    # --- Decide whether we should poll map data ---
-
-                    # 1) Try to use rich status flags exported into Indigo states.
-                    #    These are set in _async_refresh_state from s.attributes.
-                    vacuum_state = (dev.states.get("vacuum_state") or "").lower()
-                    robot_state = (dev.states.get("robot_state") or "").lower()
-                    station_state = (dev.states.get("station_state") or "").lower()
-
-                    # Some models expose a 'mapping' flag in attributes; we mirror it into states.
-                    # If present and True, we should be polling.
-                    mapping_flag = dev.states.get("mapping")
-                    if mapping_flag is None:
-                        # older devices or if we never set it → treat as unknown
-                        is_mapping = False
-                    else:
-                        # any truthy value counts
-                        is_mapping = bool(mapping_flag)
-
-                    # Activity booleans we derive from our own states
-                    segment_cleaning = bool(dev.states.get("segment_cleaning", False))
-                    zone_cleaning = bool(dev.states.get("zone_cleaning", False))
-                    spot_cleaning = bool(dev.states.get("spot_cleaning", False))
-                    returning = bool(dev.states.get("returning", False))
-
-                    # When washing at the base, map image changes (parking/wash zone etc.)
-                    washing = "wash" in vacuum_state or "washing" in robot_state or "station_cleaning" in station_state
-
-                    # 2) Fallback: old string-based status heuristic
-                    status_txt = (dev.states.get("status") or "").lower()
-                    active_keywords = ("clean", "mopp", "wash", "return", "spot")
-
-                    is_active_text = any(k in status_txt for k in active_keywords)
-
-                    # 3) Final decision:
-                    is_active = (
-                        is_mapping
-                        or segment_cleaning
-                        or zone_cleaning
-                        or spot_cleaning
-                        or returning
-                        or washing
-                        or is_active_text
-                    )
-
-                    if is_active:
-                        self.logger.debug(
-                            f"Map poll: requesting map update for '{dev.name}' "
-                            f"(vacuum_state='{vacuum_state}', status='{status_txt}')"
-                        )
-                        # fire-and-forget; ignore errors
-                        asyncio.create_task(self._async_request_map(dev))
-                    else:
-                        self.logger.debug(
-                            f"Map poll: not active for '{dev.name}' "
-                            f"(vacuum_state='{vacuum_state}', status='{status_txt}')"
-                        )
-
-                # sleep between map polls (currently ~15s)
-                await asyncio.sleep(15.0)
-            except asyncio.CancelledError:
-                break
-            except Exception as exc:
-                self.logger.error(f"Map poll error for '{dev.name}': {exc}")
-                await asyncio.sleep(60.0)
-
-        self.logger.debug(f"Map poll loop exiting for device id {dev_id}")
-
+    def _start_device_task(self, registry: dict[int, asyncio.Task], dev_id: int, kind: str, coro) -> asyncio.Task:
+        """
+        Start a per-device background loop as a named task (e.g. "poll-123"),
+        replacing (cancelling) any previous one in the same registry.
+        """
+        old = registry.get(dev_id)
+        if old is not None and not old.done():
+            old.cancel()
+        task = asyncio.create_task(coro, name=f"{kind}-{dev_id}")
+        registry[dev_id] = task
+        return task
+
+    def _map_poll_active(self, dev: indigo.Device) -> bool:
+        """
+        Whether the map is changing, so a map update is worth requesting (enableMappingUpdates devices).
+        Decided from the states _async_refresh_state last pushed (dev.states until the first push).
+        """
+        states = self._last_states.get(dev.id) or dev.states
+
+        # 1) Try to use rich status flags exported into Indigo states.
+        #    These are set in _async_refresh_state from s.attributes.
+        vacuum_state = (states.get("vacuum_state") or "").lower()
+        robot_state = (states.get("robot_state") or "").lower()
+        station_state = (states.get("station_state") or "").lower()
+
+        # Some models expose a 'mapping' flag in attributes; we mirror it into states.
+        # If present and True, we should be polling (older devices: missing → treat as not mapping).
+        is_mapping = bool(states.get("mapping"))
+
+        # Activity booleans we derive from our own states
+        segment_cleaning = bool(states.get("segment_cleaning", False))
+        zone_cleaning = bool(states.get("zone_cleaning", False))
+        spot_cleaning = bool(states.get("spot_cleaning", False))
+        returning = bool(states.get("returning", False))
+
+        # When washing at the base, map image changes (parking/wash zone etc.)
+        washing = "wash" in vacuum_state or "washing" in robot_state or "station_cleaning" in station_state
+
+        # 2) Fallback: old string-based status heuristic
+        status_txt = (states.get("status") or "").lower()
+        is_active_text = _status_text_active(status_txt) is not None
+
+        # 3) Final decision:
+        is_active = (
+            is_mapping
+            or segment_cleaning
+            or zone_cleaning
+            or spot_cleaning
+            or returning
+            or washing
+            or is_active_text
+        )
+        if self._debug_enabled:
+            self.logger.debug(
+                f"Map poll: {'requesting map update' if is_active else 'not active'} for '{dev.name}' "
+                f"(vacuum_state='{vacuum_state}', status='{status_txt}')"
+            )
+        return is_active
+
+    async def _poll_loop(self, dev: indigo.Device, client: AsyncDreameClient, status: DreameStatus | None = None):
+        """
+        Periodic polling using DreameVacuumDevice.update().
+        Polls every POLL_ACTIVE_SECONDS while working; when idle, doubles the interval
+        from POLL_IDLE_SECONDS up to POLL_IDLE_MAX_SECONDS for each unchanged poll.
+        Sending a command (see _update_status) triggers a poll POLL_WAKE_SETTLE_SECONDS later,
+        then one at the active cadence, and resets the back-off.
+        With enableMappingUpdates, each poll also requests a map update while the map is
+        changing (see _map_poll_active), and keeps the active cadence while it does.
+        A status the caller has just refreshed is used for the first pass instead of polling again.
+        """
+        wake = self._poll_wake.setdefault(dev.id, asyncio.Event())
+        idle_ticks = 0
+        last_fingerprint = None
+        woken = False
+        # Prop changes restart comm (and this loop), so the flag can be read once
+        map_updates = bool(dev.pluginProps.get("enableMappingUpdates", False))
 
-    async def _poll_loop(self, dev: indigo.Device, client: AsyncDreameClient):
-        """Simple periodic polling using DreameVacuumDevice.update()."""
         while not self.stopThread and self._clients.get(dev.id) is client:
+            interval = POLL_IDLE_SECONDS
             try:
-                await self._async_refresh_state(dev, client)
+                if status is None:
+                    status = await self._async_refresh_state(dev, client)
+                state = (status.state or "").upper()
+                fingerprint = (state, status.is_charging, status.error_code)
+                if _state_active(state) is not None:
+                    idle_ticks = 0
+                    interval = POLL_ACTIVE_SECONDS
+                else:
+                    idle_ticks = idle_ticks + 1 if fingerprint == last_fingerprint else 0
+                    interval = min(POLL_IDLE_SECONDS * (2 ** idle_ticks), POLL_IDLE_MAX_SECONDS)
+                last_fingerprint = fingerprint
             except Exception as exc:
                 self.logger.error(f"Poll error for '{dev.name}': {exc}")
-            await asyncio.sleep(30)  # Adjust to taste
+            else:
+                if map_updates:
+                    try:
+                        if self._map_poll_active(dev):
+                            interval = min(interval, POLL_ACTIVE_SECONDS)
+                            # Awaited: no Task per tick, and a slow render can't pile up overlapping requests
+                            await self._async_request_map(dev)
+                    except Exception as exc:
+                        self.logger.error(f"Map poll error for '{dev.name}': {exc}")
+            status = None
+            if woken:
+                # First poll after a command: follow up at the active cadence
+                interval = min(interval, POLL_ACTIVE_SECONDS)
+                woken = False
+
+            # Not cleared before waiting: a command sent during the poll above still wakes it
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                continue
+            # A command was sent: poll right after a short settle (further commands in it share
+            # that poll), and drop the idle back-off so its effect shows up promptly
+            await asyncio.sleep(POLL_WAKE_SETTLE_SECONDS)
+            wake.clear()
+            idle_ticks = 0
+            last_fingerprint = None
+            woken = True
 
         # In plugin.py inside Plugin._async_refresh_state – wrap error_text and add a guard so
         # Indigo only ever sees valid primitive types.
 
         # plugin.py – replace _async_refresh_state with extended mapping + safe error_text coercion
 
-    async def _async_refresh_state(self, dev: indigo.Device, client: AsyncDreameClient):
+    async def _async_refresh_state(self, dev: indigo.Device, client: AsyncDreameClient) -> DreameStatus:
         """
         Refresh Indigo device states from DreameStatus and DreameVacuumDevice.status.
-        Polling only (no push callbacks).
+        Polling only (no push callbacks). Returns the DreameStatus used.
         """
         status: DreameStatus = await client.get_status()
-        kv: list[dict] = []
+        # state key -> value; a dict, so a later write of the same key replaces the earlier one
+        kv: dict[str, object] = {}
 
-        self.logger.debug(f"_async_refresh_state: dev='{dev.name}', status={status}")
+        if self._debug_enabled:
+            self.logger.debug(f"_async_refresh_state: dev='{dev.name}', status={status}")
 
         # --- Core summary states ---
-        kv.append({"key": "status", "value": status.state_text})
-        kv.append({"key": "battery", "value": int(status.battery)})
-        kv.append({"key": "fan_speed", "value": status.fan_speed})
-        kv.append({"key": "area_cleaned_m2", "value": float(status.area_m2)})
-        kv.append({"key": "duration_min", "value": int(status.duration_min)})
-        kv.append({"key": "charging", "value": bool(status.is_charging)})
+        kv["status"] = status.state_text
+        kv["battery"] = int(status.battery)
+        kv["fan_speed"] = status.fan_speed
+        kv["area_cleaned_m2"] = float(status.area_m2)
+        kv["duration_min"] = int(status.duration_min)
+        kv["charging"] = bool(status.is_charging)
 
         # error_text from library can be list/tuple; stringify safely
         if isinstance(status.error_text, (list, tuple)):
             safe_error_text = " | ".join(str(p) for p in status.error_text)
         else:
             safe_error_text = "" if status.error_text is None else str(status.error_text)
-        kv.append({"key": "error_text", "value": safe_error_text})
+        kv["error_text"] = safe_error_text
 
-        kv.append({"key": "last_update", "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S")})
+        kv["last_update"] = time.strftime("%Y-%m-%d %H:%M:%S")
 
         # --- On/off summary for relay-like integrations ---
         # --- On/off summary for relay-like integrations ---
@@ -1568,35 +1926,37 @@ class Plugin(indigo.PluginBase):
         # Important: many attrs are *capabilities/config* (e.g. self_clean=True, auto_drying=True)
         # and must NOT be used to decide ON/OFF.
 
+        # Status objects read once per poll and shared by every block below
         device = getattr(client, "_device", None)
         s = getattr(device, "status", None)
-        attrs = getattr(s, "attributes", None) or {}
+        attrs = client.status_attrs
+        attrs_get = attrs.get
 
         # Primary truth flags (these are live runtime flags on your model)
-        running = bool(attrs.get("running", False))
-        started = bool(attrs.get("started", False))
-        paused = bool(attrs.get("paused", False))
-        returning = bool(attrs.get("returning", False))
+        running = bool(attrs_get("running", False))
+        started = bool(attrs_get("started", False))
+        paused = bool(attrs_get("paused", False))
+        returning = bool(attrs_get("returning", False))
 
-        seg_clean = bool(attrs.get("segment_cleaning", False))
-        zone_clean = bool(attrs.get("zone_cleaning", False))
-        spot_clean = bool(attrs.get("spot_cleaning", False))
+        seg_clean = bool(attrs_get("segment_cleaning", False))
+        zone_clean = bool(attrs_get("zone_cleaning", False))
+        spot_clean = bool(attrs_get("spot_cleaning", False))
 
         # Station activity flags (live activity)
-        washing = bool(attrs.get("washing", False))
-        drying = bool(attrs.get("drying", False))
-        station_cleaning = bool(attrs.get("station_cleaning", False))
+        washing = bool(attrs_get("washing", False))
+        drying = bool(attrs_get("drying", False))
+        station_cleaning = bool(attrs_get("station_cleaning", False))
 
         # Docked/charging/sleeping indicators (for safe OFF when idle)
-        docked = bool(attrs.get("docked", False))
-        charging_attr = attrs.get("charging", None)  # may be bool or missing
+        docked = bool(attrs_get("docked", False))
+        charging_attr = attrs_get("charging", None)  # may be bool or missing
         charging_attr = bool(charging_attr) if charging_attr is not None else None
 
-        state_text = str(attrs.get("status", "") or "").strip().lower()  # e.g. "Sleeping"
-        vacuum_state = str(attrs.get("vacuum_state", "") or "").strip().lower()  # e.g. "charging_completed"
+        state_text = str(attrs_get("status", "") or "").strip().lower()  # e.g. "Sleeping"
+        vacuum_state = str(attrs_get("vacuum_state", "") or "").strip().lower()  # e.g. "charging_completed"
         is_charging = bool(getattr(status, "is_charging", False))
 
-        err = str(attrs.get("error", "") or "").strip().lower()  # e.g. "Water tank" -> "water tank"
+        err = str(attrs_get("error", "") or "").strip().lower()  # e.g. "Water tank" -> "water tank"
         has_error = (vacuum_state == "error") or (err not in ("", "no error", "none", "ok"))
         # Define what counts as active work
         cleaning_work = seg_clean or zone_clean or spot_clean
@@ -1623,78 +1983,53 @@ class Plugin(indigo.PluginBase):
         else:
             # Otherwise ON only if genuinely active
             is_on = bool(active)
-        self.logger.debug(
-            f"Relay calc: active={active}, dockedish={dockedish}, is_on={is_on}, state_text='{state_text}', vacuum_state='{vacuum_state}'")
+        if self._debug_enabled:
+            self.logger.debug(
+                f"Relay calc: active={active}, dockedish={dockedish}, is_on={is_on}, state_text='{state_text}', vacuum_state='{vacuum_state}'")
 
-        kv.append({"key": "onOffState", "value": is_on})
+        kv["onOffState"] = is_on
 
         # --- Extended states from DreameVacuumDevice.status ---
-        device = getattr(client, "_device", None)
-        s = getattr(device, "status", None)
-
         # Log attributes for debugging / exploration
-        self.logger.debug(f"Dreame status attributes for '{dev.name}': {getattr(s, 'attributes', None)}")
-
-        if s is not None:
+        if self._debug_enabled:
+            self.logger.debug(f"Dreame status attributes for '{dev.name}': {attrs}")
+
+        # Current room, for the current_room state and the combined status; worked out even
+        # when the extended mapping below is skipped or fails, so it is never left stale
+        current_room_name = _room_name(attrs_get("rooms"), attrs_get("selected_map"), attrs_get("current_segment"))
+        # Nothing to map while the attributes are still empty (disconnected / just booted)
+        if s is not None and attrs:
             try:
-                attrs = getattr(s, "attributes", None) or {}
-
-                def _set_int(key, v):
-                    try:
-                        if v is not None:
-                            kv.append({"key": key, "value": int(v)})
-                    except Exception:
-                        pass
-
-                def _set_num(key, v):
+                # Plain attribute -> state copies (see _ATTR_STATE_FIELDS)
+                for key, conv in _ATTR_STATE_FIELDS:
+                    v = attrs_get(key)
+                    if v is None:
+                        continue
                     try:
-                        if v is not None:
-                            kv.append({"key": key, "value": float(v)})
-                    except Exception:
-                        pass
+                        v = conv(v)
+                    except (TypeError, ValueError, OverflowError):
+                        continue
+                    if v is not None:
+                        kv[key] = v
 
                 def _set_str(key, v):
                     try:
                         if v is not None:
                             s = str(v).strip()
                             if s != "":
-                                kv.append({"key": key, "value": s})
-                    except Exception:
+                                kv[key] = s
+                    except (TypeError, ValueError):
                         pass
 
                 def _set_bool(key, v):
                     try:
                         if v is not None:
-                            kv.append({"key": key, "value": bool(v)})
-                    except Exception:
+                            kv[key] = bool(v)
+                    except (TypeError, ValueError):
                         pass
 
-                # Lifetime totals
-                _set_num("total_cleaned_area", attrs.get("total_cleaned_area"))
-                _set_int("total_cleaning_time", attrs.get("total_cleaning_time"))
-                _set_int("cleaning_count", attrs.get("cleaning_count"))
-
-                # Current run counters
-                _set_num("cleaned_area", attrs.get("cleaned_area"))
-                _set_int("cleaning_time", attrs.get("cleaning_time"))
-
-                # Useful config / mode states
-                _set_str("suction_level", attrs.get("suction_level"))
-                _set_str("washing_mode", attrs.get("washing_mode"))
-                _set_str("mop_pad_humidity", attrs.get("mop_pad_humidity"))
-                _set_str("auto_empty_mode", attrs.get("auto_empty_mode"))
-
-                # Station / tank / consumables status
-                _set_str("clean_water_tank_status", attrs.get("clean_water_tank_status"))
-                _set_str("dirty_water_tank_status", attrs.get("dirty_water_tank_status"))
-                _set_str("dust_bag_status", attrs.get("dust_bag_status"))
-                _set_str("detergent_status", attrs.get("detergent_status"))
-
-                # Scheduling / DND / off-peak
-                _set_bool("scheduled_clean", attrs.get("scheduled_clean"))
-
                 # DND is a nested dict like {1: {'enabled': True, 'start': '21:00', 'end': '08:00'}}
-                dnd = attrs.get("dnd")
+                dnd = attrs_get("dnd")
                 if isinstance(dnd, dict) and dnd:
                     # pick first profile
                     profile = next(iter(dnd.values()))
@@ -1703,12 +2038,6 @@ class Plugin(indigo.PluginBase):
                         _set_str("dnd_start", profile.get("start"))
                         _set_str("dnd_end", profile.get("end"))
 
-                _set_bool("off_peak_charging", attrs.get("off_peak_charging"))
-                _set_str("off_peak_charging_start", attrs.get("off_peak_charging_start"))
-                _set_str("off_peak_charging_end", attrs.get("off_peak_charging_end"))
-
-                # Drying setting
-                _set_int("drying_time", attrs.get("drying_time"))
                 # Robot state / detail
                 raw_state = getattr(s, "status", None) or getattr(s, "state", None)
                 # raw_state can be an Enum or a string; attributes['status'] is already human-readable too
@@ -1716,49 +2045,39 @@ class Plugin(indigo.PluginBase):
                     state_str = raw_state.name
                 else:
                     state_str = str(raw_state) if raw_state is not None else ""
-                kv.append({"key": "robot_state", "value": state_str})
-                kv.append({"key": "robot_state_detail", "value": status.state_text})
-
-                # Live vacuum_state: 'mopping', 'drying', 'washing', etc.
-                vacuum_state = attrs.get("vacuum_state")
-                if vacuum_state is not None:
-                    kv.append({"key": "vacuum_state", "value": str(vacuum_state)})
-
-                # "Cleaning mode" here is a configuration (Sweeping/Mopping/etc.), not live state
-                mode_config = attrs.get("cleaning_mode")
-                if mode_config is not None:
-                    kv.append({"key": "cleaning_mode", "value": str(mode_config)})
+                kv["robot_state"] = state_str
+                kv["robot_state_detail"] = status.state_text
 
                 # Water / mop parameters
                 water_vol = getattr(s, "water_volume", None)
                 if water_vol is not None:
                     try:
                         if hasattr(water_vol, "value"):
-                            kv.append({"key": "water_volume", "value": int(getattr(water_vol, "value", 0))})
+                            kv["water_volume"] = int(getattr(water_vol, "value", 0))
                         else:
-                            kv.append({"key": "water_volume", "value": int(water_vol)})
-                    except Exception:
+                            kv["water_volume"] = int(water_vol)
+                    except (TypeError, ValueError, OverflowError):
                         pass
 
                 # Station / dock state (if library exposes it)
                 station_status = getattr(s, "station_status", None)
                 if station_status is not None:
                     st_name = station_status.name if hasattr(station_status, "name") else str(station_status)
-                    kv.append({"key": "station_state", "value": st_name})
+                    kv["station_state"] = st_name
 
                 # Task status (current job type)
                 try:
                     # Task status (derived current job type)
                     # Prefer Dreame booleans / vacuum_state, then fall back to text status.
-                    seg_clean = bool(attrs.get("segment_cleaning", False))
-                    zone_clean = bool(attrs.get("zone_cleaning", False))
-                    spot_clean = bool(attrs.get("spot_cleaning", False))
-                    shortcut_job = bool(attrs.get("shortcut_task", False))
-                    self_clean = bool(attrs.get("self_clean", False))
-                    washing = bool(attrs.get("washing", False))
-                    drying = bool(attrs.get("drying", False))
-                    vacuum_state = str(attrs.get("vacuum_state", "") or "").lower()
-                    attr_status = str(attrs.get("status", "") or "")
+                    seg_clean = bool(attrs_get("segment_cleaning", False))
+                    zone_clean = bool(attrs_get("zone_cleaning", False))
+                    spot_clean = bool(attrs_get("spot_cleaning", False))
+                    shortcut_job = bool(attrs_get("shortcut_task", False))
+                    self_clean = bool(attrs_get("self_clean", False))
+                    washing = bool(attrs_get("washing", False))
+                    drying = bool(attrs_get("drying", False))
+                    vacuum_state = str(attrs_get("vacuum_state", "") or "").lower()
+                    attr_status = str(attrs_get("status", "") or "")
 
                     derived_task = None
                     if shortcut_job:
@@ -1778,63 +2097,32 @@ class Plugin(indigo.PluginBase):
                     else:
                         derived_task = status.state_text or ""
 
-                    kv.append({"key": "task_status", "value": derived_task})
-                except:
-                    self.logger.debug(f"Error deriving task status for '{dev.name}': {traceback.format_exc()}")
-
-                # Water / mop parameters
-                water_vol = getattr(s, "water_volume", None)
-                if water_vol is not None:
-                    try:
-                        if hasattr(water_vol, "value"):
-                            kv.append({"key": "water_volume", "value": int(getattr(water_vol, "value", 0))})
-                        else:
-                            kv.append({"key": "water_volume", "value": int(water_vol)})
-                    except Exception:
-                        pass
+                    kv["task_status"] = derived_task
+                except Exception:
+                    if self._debug_enabled:
+                        self.logger.debug(f"Error deriving task status for '{dev.name}': {traceback.format_exc()}")
 
-                mop_wet = attrs.get("wetness_level", None) or getattr(s, "wetness_level", None)
+                # Mop parameters (water_volume is read above)
+                mop_wet = attrs_get("wetness_level", None) or getattr(s, "wetness_level", None)
                 if mop_wet is not None:
                     try:
-                        kv.append({"key": "mop_wetness_level", "value": int(mop_wet)})
-                    except Exception:
+                        kv["mop_wetness_level"] = int(mop_wet)
+                    except (TypeError, ValueError, OverflowError):
                         pass
 
-                # Cleaning progress (%)
-                cleaning_progress = attrs.get("cleaning_progress", None)
-                if cleaning_progress is not None:
-                    try:
-                        kv.append({"key": "cleaning_progress", "value": int(cleaning_progress)})
-                    except Exception:
-                        pass
-
-                # Water temperature (Normal/Mild/Warm/Hot)
-                water_temp = attrs.get("water_temperature", None)
-                if water_temp is not None:
-                    kv.append({"key": "water_temperature", "value": str(water_temp)})
-
                 # Self-wash / base status & drying
                 base_status = getattr(s, "self_wash_base_status", None)
                 if base_status is not None:
                     bs_name = base_status.name if hasattr(base_status, "name") else str(base_status)
-                    kv.append({"key": "self_wash_base_status", "value": bs_name})
+                    kv["self_wash_base_status"] = bs_name
 
-                drying_prog = attrs.get("drying_progress", None) or getattr(s, "drying_progress", None)
+                drying_prog = attrs_get("drying_progress", None) or getattr(s, "drying_progress", None)
                 if drying_prog is not None:
                     try:
-                        kv.append({"key": "drying_progress", "value": int(drying_prog)})
-                    except Exception:
+                        kv["drying_progress"] = int(drying_prog)
+                    except (TypeError, ValueError, OverflowError):
                         pass
 
-                # Auto-empty / drainage status
-                auto_empty_status = attrs.get("auto_empty_status")
-                if auto_empty_status is not None:
-                    kv.append({"key": "auto_empty_status", "value": str(auto_empty_status)})
-
-                station_drainage_status = attrs.get("station_drainage_status")
-                if station_drainage_status is not None:
-                    kv.append({"key": "station_drainage_status", "value": str(station_drainage_status)})
-
                 # Consumables
                 for src, dest in [
                     ("main_brush_left", "main_brush_left"),
@@ -1844,11 +2132,11 @@ class Plugin(indigo.PluginBase):
                     ("scale_inhibitor_left", "scale_inhibitor_left"),
                 ]:
                     # prefer attributes dict where these already exist as ints
-                    val = attrs.get(src, getattr(s, src, None))
+                    val = _attr_or_status(attrs, s, src)
                     if val is not None:
                         try:
-                            kv.append({"key": dest, "value": int(val)})
-                        except Exception:
+                            kv[dest] = int(val)
+                        except (TypeError, ValueError, OverflowError):
                             pass
 
                 # AI capabilities / flags
@@ -1856,36 +2144,36 @@ class Plugin(indigo.PluginBase):
                     ("ai_obstacle_detection", "ai_obstacle_detection"),
                     ("ai_pet_detection", "ai_pet_detection"),
                 ]:
-                    val = attrs.get(src, getattr(s, src, None))
+                    val = _attr_or_status(attrs, s, src)
                     if val is not None:
-                        kv.append({"key": dest, "value": bool(val)})
+                        kv[dest] = bool(val)
 
                 # Map / multi-floor
                 map_list = getattr(s, "map_list", None)
                 if map_list is not None:
-                    kv.append({"key": "map_list", "value": str(map_list)})
+                    kv["map_list"] = str(map_list)
 
                 # selected_map (name + id)
-                selected_map_name = attrs.get("selected_map")
+                selected_map_name = attrs_get("selected_map")
                 if selected_map_name is not None:
-                    kv.append({"key": "selected_map", "value": str(selected_map_name)})
+                    kv["selected_map"] = str(selected_map_name)
 
-                selected_map_id = attrs.get("selected_map_id")
+                selected_map_id = attrs_get("selected_map_id")
                 if selected_map_id is not None:
                     try:
-                        kv.append({"key": "current_map_id", "value": int(selected_map_id)})
+                        kv["current_map_id"] = int(selected_map_id)
                     except Exception:
                         pass
 
-                multi_floor = attrs.get("multi_floor_map", getattr(s, "multi_floor_map", None))
+                multi_floor = _attr_or_status(attrs, s, "multi_floor_map")
                 if multi_floor is not None:
-                    kv.append({"key": "multi_floor_map", "value": bool(multi_floor)})
+                    kv["multi_floor_map"] = bool(multi_floor)
 
                 # Rooms / segments: use attributes['rooms'] plus attributes['current_segment']
-                rooms_map = attrs.get("rooms") or {}
+                rooms_map = attrs_get("rooms") or {}
                 room_list_str = ""
                 current_room_str = ""
-                current_segment_id = attrs.get("current_segment")
+                current_segment_id = attrs_get("current_segment")
                 if isinstance(current_segment_id, dict):
                     # Just in case some models use a dict here
                     try:
@@ -1894,7 +2182,7 @@ class Plugin(indigo.PluginBase):
                         pass
 
                 # Shortcuts (favourites): attrs['shortcuts'] is usually a dict {id: {name: ...}, ...}
-                shortcuts = attrs.get("shortcuts")
+                shortcuts = attrs_get("shortcuts")
                 if isinstance(shortcuts, dict) and shortcuts:
                     try:
                         # Build a simple CSV: "id:name, id:name, ..."
@@ -1909,7 +2197,7 @@ class Plugin(indigo.PluginBase):
                             except Exception:
                                 continue
                         if parts:
-                            kv.append({"key": "shortcuts", "value": ", ".join(parts)})
+                            kv["shortcuts"] = ", ".join(parts)
                     except Exception:
                         pass
 
@@ -1923,42 +2211,39 @@ class Plugin(indigo.PluginBase):
                     try:
                         entries = rooms_map.get(sel_map, []) if sel_map else []
                         parts = []
-                        current_room_name = None
                         for room in entries:
                             rid = room.get("id")
                             nm = room.get("name")
                             if rid is None or not nm:
                                 continue
                             parts.append(f"{rid}:{nm}")
-                            if current_segment_id is not None and int(rid) == int(current_segment_id):
-                                current_room_name = nm
                         if parts:
                             room_list_str = ", ".join(parts)
-                            kv.append({"key": "room_list", "value": room_list_str})
+                            kv["room_list"] = room_list_str
                         if current_room_name is not None:
                             current_room_str = f"{current_segment_id}:{current_room_name}"
-                            kv.append({"key": "current_room", "value": current_room_str})
-                    except Exception:
+                            kv["current_room"] = current_room_str
+                    except (TypeError, ValueError, AttributeError):
                         # ignore room list errors, keep polling
                         pass
 
                 # Raw current_segment id
                 if current_segment_id is not None:
                     try:
-                        kv.append({"key": "current_segment_id", "value": int(current_segment_id)})
-                    except Exception:
+                        kv["current_segment_id"] = int(current_segment_id)
+                    except (TypeError, ValueError, OverflowError):
                         pass
 
                 # Cleaning sequence (list of segment IDs in order)
-                cleaning_seq = attrs.get("cleaning_sequence")
+                cleaning_seq = attrs_get("cleaning_sequence")
                 if cleaning_seq is not None:
                     try:
                         if isinstance(cleaning_seq, (list, tuple)):
                             seq_str = ",".join(str(int(x)) for x in cleaning_seq)
                         else:
                             seq_str = str(cleaning_seq)
-                        kv.append({"key": "cleaning_sequence", "value": seq_str})
-                    except Exception:
+                        kv["cleaning_sequence"] = seq_str
+                    except (TypeError, ValueError, OverflowError):
                         pass
 
             except Exception as exc:
@@ -1969,40 +2254,24 @@ class Plugin(indigo.PluginBase):
         try:
             combined = None
 
-            # Prefer attributes dict if present
-            attrs = getattr(s, "attributes", None) or {}
-
             # Basic pieces
-            vacuum_state = attrs.get("vacuum_state")  # e.g. "mopping"
-            attr_status_text = attrs.get("status")    # e.g. "Room cleaning"
-            cleaning_progress = attrs.get("cleaning_progress")
-            battery_pct = attrs.get("battery", status.battery)
-
-            # Room name from earlier mapping (room_list/current_room/current_segment_id/rooms)
-            rooms_map = attrs.get("rooms") or {}
-            selected_map_name = attrs.get("selected_map")
-            current_segment_id = attrs.get("current_segment")
-
-            current_room_name = None
-            if isinstance(current_segment_id, dict):
-                try:
-                    current_segment_id = current_segment_id.get("id") or current_segment_id.get("segment_id")
-                except Exception:
-                    pass
-
-            if isinstance(rooms_map, dict):
-                sel_map = selected_map_name if selected_map_name in rooms_map else None
-                if sel_map is None and rooms_map:
-                    sel_map = next(iter(rooms_map.keys()))
-                try:
-                    for room in rooms_map.get(sel_map, []):
-                        rid = room.get("id")
-                        nm = room.get("name")
-                        if rid is not None and nm and current_segment_id is not None and int(rid) == int(current_segment_id):
-                            current_room_name = nm
-                            break
-                except Exception:
-                    pass
+            vacuum_state = attrs_get("vacuum_state")  # e.g. "mopping"
+            attr_status_text = attrs_get("status")    # e.g. "Room cleaning"
+            cleaning_progress = attrs_get("cleaning_progress")
+            battery_pct = attrs_get("battery", status.battery)
+            err_raw = attrs_get("error", "")
+
+            # Room name: current_room_name from the room mapping above
+
+            # Same inputs as the last poll give the same sentence: skip the derivation below
+            fingerprint = (
+                vacuum_state, attr_status_text, cleaning_progress, battery_pct, err_raw,
+                status.state, status.is_charging, status.state_text, current_room_name,
+            )
+            cached = self._combined_status.get(dev.id)
+            if cached is not None and cached[0] == fingerprint:
+                kv["combined_status"] = cached[1]
+                raise StopIteration
 
             # Normalize progress text
             progress_str = None
@@ -2010,7 +2279,7 @@ class Plugin(indigo.PluginBase):
                 if cleaning_progress is not None:
                     p_int = int(cleaning_progress)
                     progress_str = f"{p_int}% completed"
-            except Exception:
+            except (TypeError, ValueError, OverflowError):
                 progress_str = None
 
             # Derive a main verb phrase from vacuum_state / attr_status / high-level state_text
@@ -2018,57 +2287,61 @@ class Plugin(indigo.PluginBase):
             vs = (str(vacuum_state).strip().lower() if vacuum_state else "")
             st = (str(attr_status_text).strip().lower() if attr_status_text else "")
 
-            err = str(attrs.get("error", "") or "").strip()
+            err = str(err_raw or "").strip()
             if vs == "error" or (err and err.lower() not in ("no error", "none", "ok")):
                 combined = f"Error: {err}" if err else "Error"
-                kv.append({"key": "combined_status", "value": combined})
+                kv["combined_status"] = combined
+                self._combined_status[dev.id] = (fingerprint, combined)
                 # Skip the rest of the verb logic
                 raise StopIteration
 
             # Examples from const.py: SWEEPING, MOPPING, SWEEPING_AND_MOPPING, RETURNING, CHARGING, WASHING, DRYING, etc.
-            if "mopp" in vs or "mopping" in st:
+            state_upper = (status.state or "").upper()
+            # One regex pass per text collects every verb keyword; the chain below is set lookups
+            vs_words = set(_verb_words(vs))
+            st_words = set(_verb_words(st))
+            words = vs_words | st_words
+            if "mopp" in words:
                 # Could also differentiate "Sweeping and mopping"
-                if "sweeping and mopping" in st or "sweeping and mopping" in vs:
+                if "sweep" in st_words and "mopp" in st_words or "sweep" in vs_words and "mopp" in vs_words:
                     verb = "Sweeping and mopping"
                 else:
                     verb = "Mopping"
-            elif "sweep" in vs or "sweep" in st or "clean" in st:
+            elif "sweep" in words or "clean" in st_words:
                 verb = "Cleaning"
-            elif "return" in vs or "return" in st or status.state.upper() in ("BACK_HOME", "RETURNING"):
+            elif "return" in words or state_upper in _RETURNING_STATES:
                 verb = "Returning to dock"
-            elif "charging" in vs or "charging" in st or status.is_charging:
+            elif "charging" in words or status.is_charging:
                 verb = "Charging"
-            elif "washing" in vs or "washing" in st:
+            elif "washing" in words:
                 verb = "Washing mop"
-            elif "drying" in vs or "drying" in st:
+            elif "drying" in words:
                 verb = "Drying mop"
-            elif "docked" in st or status.state.upper() == "DOCKED":
+            elif "docked" in st_words or state_upper == "DOCKED":
                 verb = "Docked"
-            elif "paused" in st or status.state.upper() == "PAUSED":
+            elif "paused" in st_words or state_upper == "PAUSED":
                 verb = "Paused"
-            elif "idle" in st or status.state.upper() == "IDLE":
+            elif "idle" in st_words or state_upper == "IDLE":
                 verb = "Idle"
             else:
                 # Fallback to existing human-readable state_text (e.g. "Room cleaning")
                 verb = status.state_text or "Unknown"
 
             # Now assemble a natural English sentence
-            if verb.startswith("Charging") or "charging" in verb.lower():
-                # "Charging, Battery 50%"
-                combined = f"{verb}, Battery {int(battery_pct)}%"
-            elif verb.startswith("Returning"):
-                # "Returning to dock, Battery 50%"
+            form = _verb_form(verb)
+            if form == "battery":
+                # "Charging, Battery 50%" / "Returning to dock, Battery 50%"
                 combined = f"{verb}, Battery {int(battery_pct)}%"
-            elif "washing mop" in verb.lower() or "drying mop" in verb.lower():
+            elif form == "plain":
                 # "Washing mop" / "Drying mop"
                 combined = verb
-            elif ("clean" in verb.lower() or "mopp" in verb.lower()) and current_room_name:
+            elif form == "cleaning" and current_room_name:
                 # "Mopping 'Kitchen 2' 35% completed"
                 if progress_str:
                     combined = f"{verb} '{current_room_name}' {progress_str}"
                 else:
                     combined = f"{verb} '{current_room_name}'"
-            elif "clean" in verb.lower() or "mopp" in verb.lower():
+            elif form == "cleaning":
                 # "Cleaning, 35% completed" / "Mopping, 35% completed"
                 if progress_str:
                     combined = f"{verb}, {progress_str}"
@@ -2082,20 +2355,28 @@ class Plugin(indigo.PluginBase):
                     combined = verb
 
             if combined is not None:
-                kv.append({"key": "combined_status", "value": combined})
+                kv["combined_status"] = combined
+                self._combined_status[dev.id] = (fingerprint, combined)
 
         except StopIteration:
             pass
         except Exception as exc:
             self.logger.debug(f"Combined status build failed for '{dev.name}': {exc}")
 
-        # Push state updates to Indigo
+        # Push state updates to Indigo; only states whose value differs from what was last pushed.
+        # (Not dev.states: this instance goes stale when actions write 'status' through their own dev.)
         try:
-            dev.updateStatesOnServer(kv)
+            last = self._last_states.setdefault(dev.id, {})
+            changed = [{"key": k, "value": v} for k, v in kv.items() if k not in last or last[k] != v]
+            if changed:
+                dev.updateStatesOnServer(changed)
+                last.update(kv)
             # Optionally update image based on onOffState
         except Exception as exc:
             self.logger.error(f"Failed to update states for '{dev.name}': {exc}")
 
+        return status
+
     async def _async_start_clean(self, dev: indigo.Device):
         client = self._clients.get(dev.id)
         if not client:
@@ -2113,7 +2394,7 @@ class Plugin(indigo.PluginBase):
         """
         Action: Clean selected room by name (via segment id from roomMenu).
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
+        if not self._can_act(dev):
             return
 
         segment_id_str = (plugin_action.props.get("roomMenu") or "").strip()
@@ -2121,23 +2402,15 @@ class Plugin(indigo.PluginBase):
             self.logger.error(f"Clean Room: no room selected for '{dev.name}'")
             return
 
-        try:
-            segment_id = int(segment_id_str)
-        except Exception:
+        segment_id = _parse_int(segment_id_str)
+        if segment_id is None:
             self.logger.error(f"Clean Room: invalid segment id '{segment_id_str}' for '{dev.name}'")
             return
 
-        repeats_raw = (plugin_action.props.get("repeats") or "").strip() or "1"
-        try:
-            repeats = int(repeats_raw)
-        except Exception:
-            repeats = 1
+        repeats = _parse_int(plugin_action.props.get("repeats"), 1)
 
         self.logger.info(f"Clean Room: segment {segment_id} (repeats={repeats}) requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(
-            self._async_clean_segments(dev, [segment_id], repeats),
-            self._event_loop,
-        )
+        self._submit(self._async_clean_segments(dev, [segment_id], repeats))
 
     async def _async_clean_segments(
         self,
@@ -2156,9 +2429,7 @@ class Plugin(indigo.PluginBase):
             return
         try:
             await client.clean_segment(segments, repeats=repeats, suction_level=suction_level, water_volume=water_volume)
-            # Optional: use first segment for status text
-            seg_str = ", ".join(str(s) for s in segments)
-            self._update_status(dev, f"Cleaning segments {seg_str}")
+            self._update_status(dev, f"Cleaning segments {', '.join(map(str, segments))}")
         except Exception as exc:
             self._update_status(dev, f"Segment clean failed: {exc}")
     # Dynamic lists for Actions (room selection)
@@ -2180,7 +2451,7 @@ class Plugin(indigo.PluginBase):
         result: list[tuple[str, str]] = []
 
         dev = indigo.devices.get(dev_id)
-        if not dev or dev.deviceTypeId != "dreame_vacuum":
+        if not dev or dev.deviceTypeId != VACUUM_TYPE_ID:
             return result
 
         raw = dev.states.get("shortcuts", "") or ""
@@ -2190,24 +2461,7 @@ class Plugin(indigo.PluginBase):
             return result
 
         try:
-            for part in raw.split(","):
-                part = part.strip()
-                if not part:
-                    continue
-                if ":" not in part:
-                    continue
-                sid_str, name = part.split(":", 1)
-                sid_str = sid_str.strip()
-                name = name.strip()
-                if not sid_str or not name:
-                    continue
-                # Ensure sid is numeric; if not, we still allow it as a string id.
-                try:
-                    int(sid_str)
-                except Exception:
-                    pass
-                label = f"{name} ({sid_str})"
-                result.append((sid_str, label))
+            result = list(_shortcut_menu_items(raw))
         except Exception as exc:
             self.logger.debug(f"shortcut_menu: failed to parse shortcuts '{raw}' for '{dev.name}': {exc}")
             return []
@@ -2234,7 +2488,7 @@ class Plugin(indigo.PluginBase):
 
         # Indigo passes the target device id in dev_id for action UI
         dev = indigo.devices.get(dev_id)
-        if not dev or dev.deviceTypeId != "dreame_vacuum":
+        if not dev or dev.deviceTypeId != VACUUM_TYPE_ID:
             return result
 
         # We expect 'room_list' state to look like: "1:Balcony, 2:Laundry, 7:Kitchen 2, ..."
@@ -2246,21 +2500,7 @@ class Plugin(indigo.PluginBase):
             return result
 
         try:
-            for part in raw.split(","):
-                part = part.strip()
-                if not part:
-                    continue
-                # "id:name"
-                if ":" in part:
-                    sid_str, name = part.split(":", 1)
-                    sid_str = sid_str.strip()
-                    name = name.strip()
-                    if not sid_str or not name:
-                        continue
-                    # Ensure it's numeric so we don't hand garbage to the action
-                    int(sid_str)
-                    label = f"{name} ({sid_str})"
-                    result.append((sid_str, label))
+            result = list(_room_menu_items(raw))
         except Exception as exc:
             self.logger.debug(f"room_menu: failed to parse room_list '{raw}' for '{dev.name}': {exc}")
             return []
@@ -2306,27 +2546,17 @@ class Plugin(indigo.PluginBase):
             dev.updateStateOnServer("status", text)
         except Exception:
             pass
+        # Record it, so the next poll puts the real status back rather than skipping it as unchanged
+        last = self._last_states.get(dev.id)
+        if last is not None:
+            last["status"] = text
+        # Every action reports through here: nudge the poll loop out of idle back-off
+        wake = self._poll_wake.get(dev.id)
+        if wake is not None:
+            wake.set()
     ####
     #Actions
 
-    async def _async_clean_segments(
-        self,
-        dev: indigo.Device,
-        segments: list[int],
-        repeats: int = 1,
-        suction_level: str = "",
-        water_volume: str = "",
-    ):
-        client = self._clients.get(dev.id)
-        if not client:
-            self._update_status(dev, "Not connected")
-            return
-        try:
-            await client.clean_segment(segments, repeats=repeats, suction_level=suction_level, water_volume=water_volume)
-            self._update_status(dev, f"Cleaning segments {segments}")
-        except Exception as exc:
-            self._update_status(dev, f"Segment clean failed: {exc}")
-
     async def _async_clean_zones(self, dev: indigo.Device, zones: list[list[int]], repeats: int = 1):
         client = self._clients.get(dev.id)
         if not client:
@@ -2344,7 +2574,7 @@ class Plugin(indigo.PluginBase):
         segments: comma-separated list of ids, e.g. "2,3,5"
         repeats, suction_level, water_volume are optional.
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
+        if not self._can_act(dev):
             return
 
         raw_segments = (plugin_action.props.get("segments") or "").strip()
@@ -2352,19 +2582,14 @@ class Plugin(indigo.PluginBase):
             self.logger.error(f"Clean segments requested for '{dev.name}' but no segments provided")
             return
 
-        try:
-            segments = [int(s.strip()) for s in raw_segments.split(",") if s.strip()]
-        except Exception:
+        segments = _parse_int_list(raw_segments)
+        if segments is None:
             self.logger.error(
                 f"Clean segments requested for '{dev.name}' but segments '{raw_segments}' are invalid"
             )
             return
 
-        repeats_raw = (plugin_action.props.get("repeats") or "").strip() or "1"
-        try:
-            repeats = int(repeats_raw)
-        except Exception:
-            repeats = 1
+        repeats = _parse_int(plugin_action.props.get("repeats"), 1)
 
         suction_level = (plugin_action.props.get("suction_level") or "").strip()
         water_volume = (plugin_action.props.get("water_volume") or "").strip()
@@ -2373,17 +2598,14 @@ class Plugin(indigo.PluginBase):
             f"Clean segments {segments} (repeats={repeats}, suction={suction_level!r}, "
             f"water={water_volume!r}) requested for '{dev.name}'"
         )
-        asyncio.run_coroutine_threadsafe(
-            self._async_clean_segments(dev, segments, repeats, suction_level, water_volume),
-            self._event_loop,
-        )
+        self._submit(self._async_clean_segments(dev, segments, repeats, suction_level, water_volume))
 
     def clean_zones(self, plugin_action, dev):
         """
         Action: clean one or more rectangular zones.
         zones string: "x1,y1,x2,y2; x1,y1,x2,y2; ..."
         """
-        if dev.deviceTypeId != "dreame_vacuum" or not self._event_loop:
+        if not self._can_act(dev):
             return
 
         raw_zones = (plugin_action.props.get("zones") or "").strip()
@@ -2396,32 +2618,22 @@ class Plugin(indigo.PluginBase):
             part = part.strip()
             if not part:
                 continue
-            try:
-                x1, y1, x2, y2 = [int(v.strip()) for v in part.split(",")]
-                zones.append([x1, y1, x2, y2])
-            except Exception:
+            match = _ZONE_RE.fullmatch(part)
+            if match is None:
                 self.logger.error(f"Invalid zone rectangle '{part}' for '{dev.name}'")
                 return
+            zones.append(list(map(int, match.groups())))
 
-        repeats_raw = (plugin_action.props.get("repeats") or "").strip() or "1"
-        try:
-            repeats = int(repeats_raw)
-        except Exception:
-            repeats = 1
+        repeats = _parse_int(plugin_action.props.get("repeats"), 1)
 
         self.logger.info(f"Clean zones {zones} (repeats={repeats}) requested for '{dev.name}'")
-        asyncio.run_coroutine_threadsafe(
-            self._async_clean_zones(dev, zones, repeats),
-            self._event_loop,
-        )
+        self._submit(self._async_clean_zones(dev, zones, repeats))
 
     async def _async_save_map_snapshot(self, dev: indigo.Device, wifi: bool = False):
         """
         Common helper for saving a floor or wifi map snapshot to ~/Pictures.
         wifi=False → floor map, wifi=True → wifi map (if available).
         """
-        from dreame_camera import DreameCameraHelper, DreameCameraConfig  # local helper
-
         client = self._clients.get(dev.id)
         if not client:
             self._update_status(dev, "Not connected")
@@ -2441,16 +2653,24 @@ class Plugin(indigo.PluginBase):
                 map_index=0,
                 wifi_map=wifi,
             )
-            helper = DreameCameraHelper(device, cfg)
-
-            import os
             pictures_dir = os.path.expanduser("~/Pictures")
-            full_path = helper.save_snapshot_to_file(
-                base_dir=pictures_dir,
-                dev_id=dev.id,
-                prefix="DreameMap",
-                wifi=wifi,
-            )
+
+            # Map fetch + PIL render + PNG encode are blocking; keep them off the event loop
+            def _render_and_save():
+                cached = self._camera_helpers.get((dev.id, wifi))
+                if cached and cached[0] is device:
+                    helper = cached[1]
+                else:
+                    helper = DreameCameraHelper(device, cfg)
+                    self._camera_helpers[(dev.id, wifi)] = (device, helper)
+                return helper.save_snapshot_to_file(
+                    base_dir=pictures_dir,
+                    dev_id=dev.id,
+                    prefix="DreameMap",
+                    wifi=wifi,
+                )
+
+            full_path = await client._run_render(_render_and_save)
 
             if not full_path:
                 msg = "WiFi map snapshot failed: no image data" if wifi else "Map snapshot failed: no image data"
@@ -2493,8 +2713,6 @@ class Plugin(indigo.PluginBase):
         - if dreame_device_id set, pick that device; else first supported device
         - return (host, token, mac, model, device_id, auth_key, account_type_normalized)
         """
-        from dreame.protocol import DreameVacuumProtocol
-
         # Normalize from Indigo UI values to HA-style internal values
         # Indigo: 'dreame', 'mihome', 'mova'
         # HA:     'dreame', 'mi',     'mova', 'local'
@@ -2518,20 +2736,40 @@ class Plugin(indigo.PluginBase):
             f"country={country!r}, username_set={bool(username)}"
         )
 
+        # Session from the last successful login (Dreame refresh token / Mi service token).
+        # With it the cloud lib refreshes or just verifies the session instead of a full password login.
+        # dev.pluginProps hands back a fresh copy on every access: take it once
+        # Only reused for the login it was issued for: changed username/country/account type -> full login
+        props = dev.pluginProps
+        account = _auth_account(username, country, account_type)
+        stored_auth = (props.get("authKey") or "").strip() or None
+        if stored_auth and props.get("authKeyAccount") != account:
+            self.logger.debug(f"Stored cloud session for '{dev.name}' belongs to other credentials; not reusing it")
+            stored_auth = None
+
         # 1) Build protocol for cloud login
-        proto = DreameVacuumProtocol(
-            username=username,
-            password=password,
-            country=country,
-            prefer_cloud=True,
-            account_type=account_type,
-        )
+        def _make_proto(auth_key):
+            return DreameVacuumProtocol(
+                username=username,
+                password=password,
+                country=country,
+                prefer_cloud=True,
+                account_type=account_type,
+                auth_key=auth_key,
+            )
+
+        proto = _make_proto(stored_auth)
 
         # 2) Call cloud.login() in executor (HA uses hass.async_add_executor_job)
         def _login():
             return proto.cloud.login()
 
-        ok = await asyncio.get_event_loop().run_in_executor(None, _login)
+        ok = await asyncio.get_running_loop().run_in_executor(self._cloud_executor, _login)
+        if (not ok or not proto.cloud.logged_in) and stored_auth:
+            # Stored session expired or was revoked: fall back to a full login once
+            self.logger.debug(f"Stored cloud session rejected for '{dev.name}', retrying with password")
+            proto = _make_proto(None)
+            ok = await asyncio.get_running_loop().run_in_executor(self._cloud_executor, _login)
         if not ok or not proto.cloud.logged_in:
             self.logger.error(
                 f"Cloud login failed for '{dev.name}' (account_type={account_type}, country={country})"
@@ -2553,8 +2791,8 @@ class Plugin(indigo.PluginBase):
             return proto.cloud.get_supported_devices(models, host, mac)
 
         try:
-            supported_devices, unsupported_devices = await asyncio.get_event_loop().run_in_executor(
-                None, _get_supported
+            supported_devices, unsupported_devices = await asyncio.get_running_loop().run_in_executor(
+                self._cloud_executor, _get_supported
             )
         except Exception as exc:
             self.logger.error(f"get_supported_devices failed for '{dev.name}': {exc}")
@@ -2570,7 +2808,7 @@ class Plugin(indigo.PluginBase):
 
         # 4) Choose device: use dreame_device_id if set, else first entry
         # 4) Choose device: use dreame_device_id if set, else first entry
-        wanted_did = (dev.pluginProps.get("dreame_device_id") or "").strip() or None
+        wanted_did = (props.get("dreame_device_id") or "").strip() or None
         chosen_device = None
 
         if wanted_did:
@@ -2604,6 +2842,9 @@ class Plugin(indigo.PluginBase):
         )
 
         auth_key = getattr(proto.cloud, "auth_key", None)
+        if auth_key and auth_key != stored_auth:
+            # Persist the (possibly rotated) session for the next start
+            self._update_dreame_login_info(dev, auth_key=auth_key, account=account)
 
         self.logger.debug(
             f"After extract: host={host2!r}, token_len={len(token2) if token2 else 0}, "
@@ -2628,31 +2869,11 @@ class Plugin(indigo.PluginBase):
 
         models: { "xiaomi.vacuum.xxx" | "mova.vacuum.xxx" | "dreame.vacuum.xxx" : model_type_id }
         """
-        from dreame.const import DEVICE_INFO  # or wherever DEVICE_INFO lives in your vendored dreame
-
-        models: dict[str, int] = {}
         try:
-            import base64, json, zlib
-
-            device_info = json.loads(
-                zlib.decompress(base64.b64decode(DEVICE_INFO), zlib.MAX_WBITS | 32)
-            )
-            # device_info[3]: model keys; device_info[0]: info indexed by that mapping
-            for k in device_info[3]:
-                info = device_info[0][device_info[3][k]]
-                if info:
-                    # info[0] == 1 → Xiaomi, 2 → Mova, else Dreame (mirrors HA)
-                    vendor_prefix = (
-                        "xiaomi"
-                        if info[0] == 1
-                        else "mova"
-                        if info[0] == 2
-                        else "dreame"
-                    )
-                    models[f"{vendor_prefix}.vacuum.{k}"] = info[1]
+            return _device_info_models()
         except Exception as exc:
             self.logger.error(f"Failed to load models from DEVICE_INFO: {exc}")
-        return models
+            return {}
 
     def _extract_device_info(
         self,
@@ -2669,40 +2890,27 @@ class Plugin(indigo.PluginBase):
         account_type here should be one of: 'mi', 'dreame', 'mova', 'local'.
         Indigo UI uses 'mihome' for Xiaomi; we map that earlier before calling this.
         """
-        mac = None
-        model = None
-        name = None
-        device_id = None
-
-        at = account_type
-
-        if at == "mi":
+        # mac/model/name start out unset here, so HA's "keep if already set" guards only apply to host/token
+        get = device.get
+        if account_type == "mi":
             # HA's ACCOUNT_TYPE_MI
-            if host is None:
-                host = device.get("localip")
-            if mac is None:
-                mac = device.get("mac")
-            if model is None:
-                model = device.get("model")
-            if name is None:
-                name = device.get("name")
-            token = device.get("token")
-            device_id = device.get("did")
-        elif at in ("dreame", "mova"):
+            return (
+                get("localip") if host is None else host,
+                get("token"),
+                get("mac"),
+                get("model"),
+                get("name"),
+                get("did"),
+            )
+        if account_type in ("dreame", "mova"):
             # HA's ACCOUNT_TYPE_DREAME / ACCOUNT_TYPE_MOVA
-            if token is None:
-                token = " "
-            if host is None:
-                host = device.get("bindDomain")
-            if mac is None:
-                mac = device.get("mac")
-            if model is None:
-                model = device.get("model")
-            if name is None:
-                custom_name = device.get("customName") or ""
-                device_info = (device.get("deviceInfo") or {})
-                display_name = device_info.get("displayName") or "Dreame Vacuum"
-                name = custom_name if len(custom_name) > 0 else display_name
-            device_id = device.get("did")
-
-        return host, token, mac, model, name, device_id
\ No newline at end of file
+            name = get("customName") or (get("deviceInfo") or {}).get("displayName") or "Dreame Vacuum"
+            return (
+                get("bindDomain") if host is None else host,
+                " " if token is None else token,
+                get("mac"),
+                get("model"),
+                name,
+                get("did"),
+            )
+        return host, token, None, None, None, None